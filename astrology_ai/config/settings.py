@@ -273,6 +273,10 @@ def get_rules_dir() -> Path:
     """Get the rules directory path"""
     return get_config().directories.rules_dir
 
+def get_cache_dir() -> Path:
+    """Get the cache directory path"""
+    return get_config().directories.cache_dir
+
 def get_database_path(db_type: str = "main") -> Path:
     """Get database path"""
     return get_config().get_database_path(db_type)
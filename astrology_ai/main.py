@@ -10,9 +10,6 @@ Uses centralized configuration for all paths and settings.
 import sys
 from pathlib import Path
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 # Import configuration system
 config_path = Path(__file__).parent / "config"
 sys.path.insert(0, str(config_path))
@@ -24,12 +21,15 @@ except ImportError:
     get_config = None
     AstrologyAIConfig = None
 
+def _banner():
+    """Print the welcome banner shown by the non-CLI commands"""
+    print("🌌 Welcome to Astrology AI - Phase 1\n" + "=" * 50)
+
 def main():
     """Main entry point with options for different use cases"""
     
     if len(sys.argv) == 1:
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
+        _banner()
         show_help()
         return
     
@@ -40,34 +40,28 @@ def main():
         sys.argv = sys.argv[1:]  # Remove 'cli' from arguments
         from src.cli import cli
         cli()
-        
-    elif command == 'demo':
+        return
+    
+    # Click owns the output of the cli branch; everything else gets the banner
+    _banner()
+    
+    if command == 'demo':
         # Run a quick demo
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
         run_demo()
         
     elif command == 'test':
         # Test the system
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
         test_system()
         
     elif command == 'setup':
         # Initial setup
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
         setup_system()
         
     elif command == 'config':
         # Show configuration info
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
         show_config_info()
         
     else:
-        print("🌌 Welcome to Astrology AI - Phase 1")
-        print("=" * 50)
         print(f"❌ Unknown command: {command}")
         show_help()
 
@@ -140,9 +134,10 @@ def setup_system():
         print(f"❌ Setup error: {e}")
         return
     
-    # Test imports
+    # Test imports (the heavy components are resolved lazily, so each one is
+    # named here to actually import its module)
     try:
-        from src import AstrologyAI
+        from src import AstrologyAI, DocumentProcessor, RuleExtractor, KnowledgeBase
         print("✅ Core modules imported successfully")
     except ImportError as e:
         print(f"❌ Import error: {e}")
@@ -237,11 +232,11 @@ def run_demo():
         # Show some searches
         kb = demo['knowledge_base']
         
-        mars_rules = kb.search_rules(planet="Mars")
-        print(f"✅ Found {len(mars_rules)} Mars-related rules")
+        mars_count = kb.count_search_rules(planet="Mars")
+        print(f"✅ Found {mars_count} Mars-related rules")
         
-        house7_rules = kb.search_rules(house=7)
-        print(f"✅ Found {len(house7_rules)} 7th house rules")
+        house7_count = kb.count_search_rules(house=7)
+        print(f"✅ Found {house7_count} 7th house rules")
         
         # Show stats
         stats = kb.get_database_stats()
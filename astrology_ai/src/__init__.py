@@ -20,11 +20,16 @@ from .data_models import (
     AuthorityLevel
 )
 
-from .document_processor import DocumentProcessor
-from .rule_extractor import RuleExtractor  
-from .knowledge_base import KnowledgeBase
+# Heavy components are resolved on first attribute access (PEP 562) so that
+# importing the package does not pull in the PDF/NLP/database stack
+_LAZY = {
+    'DocumentProcessor': '.document_processor',
+    'RuleExtractor': '.rule_extractor',
+    'KnowledgeBase': '.knowledge_base',
+}
 
 # Configuration system
+import importlib
 import sys
 from pathlib import Path
 
@@ -50,14 +55,37 @@ except ImportError:
     def get_config():
         return MockConfig()
 
+def __getattr__(name):
+    """Lazily import heavy components listed in _LAZY"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
+
 # Utility functions
 def get_version():
     """Get the current version of Astrology AI"""
     return __version__
 
+# Sample rules as (text, source_title, create_simple_rule keyword arguments)
+_DEMO_SPECS = (
+    ("Mars in the 7th house causes conflicts in marriage", "Classical Astrology Text",
+     {"planet": "Mars", "house": 7, "effect_desc": "conflicts in marriage"}),
+    ("Jupiter in its own sign gives wisdom and prosperity", "Classical Astrology Text",
+     {"planet": "Jupiter", "effect_desc": "wisdom and prosperity"}),
+)
+
 def create_demo_system():
     """Create a demo system with sample data"""
     from .data_models import create_simple_rule
+    from .document_processor import DocumentProcessor
+    from .rule_extractor import RuleExtractor
+    from .knowledge_base import KnowledgeBase
     
     # Initialize components with configuration
     config = get_config()
@@ -65,22 +93,8 @@ def create_demo_system():
     extractor = RuleExtractor()
     kb = KnowledgeBase(str(get_database_path()))
     
-    # Create some demo rules
-    demo_rules = [
-        create_simple_rule(
-            "Mars in the 7th house causes conflicts in marriage",
-            "Classical Astrology Text",
-            planet="Mars",
-            house=7,
-            effect_desc="conflicts in marriage"
-        ),
-        create_simple_rule(
-            "Jupiter in its own sign gives wisdom and prosperity",
-            "Classical Astrology Text", 
-            planet="Jupiter",
-            effect_desc="wisdom and prosperity"
-        )
-    ]
+    # Create the demo rules
+    demo_rules = [create_simple_rule(text, source, **fields) for text, source, fields in _DEMO_SPECS]
     
     # Store demo rules
     kb.store_rules_batch(demo_rules)
@@ -122,6 +136,10 @@ class AstrologyAI:
             self.db_path = str(get_database_path())
         
         # Initialize components
+        from .document_processor import DocumentProcessor
+        from .rule_extractor import RuleExtractor
+        from .knowledge_base import KnowledgeBase
+        
         self.processor = DocumentProcessor()
         self.extractor = RuleExtractor()
         self.knowledge_base = KnowledgeBase(self.db_path)
@@ -6,9 +6,11 @@ Uses centralized configuration for all paths and settings
 """
 
 import click
+import contextlib
+import functools
+import itertools
+import os
 from pathlib import Path
-import json
-import yaml
 from datetime import datetime
 
 # Import configuration system
@@ -17,7 +19,7 @@ config_path = Path(__file__).parent.parent / "config"
 sys.path.insert(0, str(config_path))
 
 try:
-    from settings import get_config, get_database_path, get_export_path, get_books_dir
+    from settings import get_config, get_database_path, get_export_path, get_books_dir, get_cache_dir
 except ImportError:
     # Fallback for when config system is not available
     def get_config():
@@ -28,22 +30,66 @@ except ImportError:
         return Path("data") / filename
     def get_books_dir():
         return Path("data/books")
+    def get_cache_dir():
+        return Path("data/cache")
 
-# Import our modules
-from .document_processor import DocumentProcessor
-from .rule_extractor import RuleExtractor
-from .knowledge_base import KnowledgeBase
-from .data_models import SourceInfo, AuthorityLevel
+# Heavy modules (PDF parsing, rule extraction, SQLite) are imported inside
+# the commands that use them so that --help and light commands start fast
+
+# CLI authority names; each matches an AuthorityLevel member
+_AUTHORITY_CHOICES = ('classical', 'traditional', 'modern', 'commentary')
+
+# One Choice type shared by every --authority option
+_AUTHORITY_CHOICE = click.Choice(_AUTHORITY_CHOICES)
+
+# Authority level lookup, built on first use so startup skips data_models
+_AUTHORITY_MAP = None
+
+def _authority_map():
+    """Get the CLI authority name -> AuthorityLevel mapping"""
+    global _AUTHORITY_MAP
+    
+    if _AUTHORITY_MAP is None:
+        from .data_models import AuthorityLevel
+        _AUTHORITY_MAP = {name: AuthorityLevel[name.upper()] for name in _AUTHORITY_CHOICES}
+    
+    return _AUTHORITY_MAP
+
+
+@functools.lru_cache(maxsize=1)
+def _get_processor():
+    """Get the DocumentProcessor shared within this process"""
+    from .document_processor import DocumentProcessor
+    return DocumentProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_extractor():
+    """Get the RuleExtractor shared within this process"""
+    from .rule_extractor import RuleExtractor
+    return RuleExtractor(cache_path=str(get_cache_dir() / "rule_cache.sqlite"))
+
+
+def _knowledge_base(ctx):
+    """Get the KnowledgeBase shared by every command in this invocation"""
+    state = ctx.ensure_object(dict)
+    
+    if 'kb' not in state:
+        from .knowledge_base import KnowledgeBase
+        state['kb'] = KnowledgeBase()  # Uses configuration for database path
+    
+    return state['kb']
 
 
 @click.group()
 @click.version_option(version='1.0.0')
-def cli():
+@click.pass_context
+def cli(ctx):
     """🌌 Astrology AI - Ancient Wisdom meets Modern Intelligence
     
     Phase 1: Foundation & Rule Extraction System
     """
-    pass
+    ctx.ensure_object(dict)
 
 
 @cli.command()
@@ -51,91 +97,103 @@ def cli():
 @click.option('--source-title', '-t', help='Title of the source book')
 @click.option('--author', '-a', help='Author of the source')
 @click.option('--authority', '-l', 
-              type=click.Choice(['classical', 'traditional', 'modern', 'commentary']),
+              type=_AUTHORITY_CHOICE,
               default='modern', help='Authority level of the source')
 @click.option('--extract-rules', '-r', is_flag=True, help='Extract rules and store in knowledge base')
 @click.option('--show-samples', '-s', is_flag=True, help='Show sample sentences')
 @click.option('--output', '-o', type=click.Path(), help='Output file for results')
-def process_book(pdf_path, source_title, author, authority, extract_rules, show_samples, output):
+@click.option('--no-cache', is_flag=True, help='Re-extract every sentence instead of reusing cached rules')
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=1,
+              help='Worker processes for extracting text from long books (default 1, no pool)')
+@click.pass_context
+def process_book(ctx, pdf_path, source_title, author, authority, extract_rules, show_samples, output, no_cache, workers):
     """Process an astrology book and optionally extract rules"""
+    from .data_models import SourceInfo
     
     click.echo(f"📚 Processing: {Path(pdf_path).name}")
     
     # Initialize components
-    processor = DocumentProcessor()
+    processor = _get_processor()
     
     try:
         # Process the PDF
-        result = processor.process_document(pdf_path)
+        result = processor.process_document(pdf_path, workers=workers)
+        n_total = result.sentence_count
+        astro = result.astrological_sentences
+        n_astro = len(astro)
+        ratio = (n_astro / n_total * 100) if n_total else 0.0
+        stored_count = 0
         
-        # Display basic results
-        click.echo(f"\n📊 Processing Results:")
-        click.echo(f"   Document: {result.filename}")
-        click.echo(f"   Total sentences: {len(result.sentences)}")
-        click.echo(f"   Astrological sentences: {len(result.astrological_sentences)}")
-        click.echo(f"   Content ratio: {len(result.astrological_sentences)/len(result.sentences)*100:.1f}%")
+        # Display basic results, written as one block
+        lines = [
+            "\n📊 Processing Results:",
+            f"   Document: {result.filename}",
+            f"   Total sentences: {n_total}",
+            f"   Astrological sentences: {n_astro}",
+            f"   Content ratio: {ratio:.1f}%"
+        ]
         
         if show_samples:
-            click.echo(f"\n🔍 Sample astrological sentences:")
-            for i, sentence in enumerate(result.astrological_sentences[:5]):
-                click.echo(f"   {i+1}. {sentence[:100]}...")
+            lines.append("\n🔍 Sample astrological sentences:")
+            for i, sentence in enumerate(astro[:5]):
+                lines.append(f"   {i+1}. {sentence[:100]}...")
+        
+        click.echo('\n'.join(lines))
         
         # Extract rules if requested
         if extract_rules:
             click.echo(f"\n🔄 Extracting rules...")
             
             # Create source info
-            authority_map = {
-                'classical': AuthorityLevel.CLASSICAL,
-                'traditional': AuthorityLevel.TRADITIONAL, 
-                'modern': AuthorityLevel.MODERN,
-                'commentary': AuthorityLevel.COMMENTARY
-            }
-            
             source_info = SourceInfo(
                 title=source_title or result.filename,
                 author=author,
-                authority_level=authority_map[authority]
+                authority_level=_authority_map()[authority]
             )
             
             # Extract rules
-            extractor = RuleExtractor()
+            extractor = _get_extractor()
             rules = extractor.extract_rules_from_sentences(
-                result.astrological_sentences, 
-                source_info
+                astro, 
+                source_info,
+                use_cache=not no_cache
             )
             
             click.echo(f"   Extracted {len(rules)} rules")
             
             # Store in knowledge base using configuration
             if rules:
-                kb = KnowledgeBase()  # Uses configuration for database path
+                kb = _knowledge_base(ctx)
                 stored_count = kb.store_rules_batch(rules)
-                click.echo(f"   ✅ Stored {stored_count} rules in knowledge base")
+                lines = [f"   ✅ Stored {stored_count} rules in knowledge base"]
                 
                 # Show rule samples
-                click.echo(f"\n📝 Sample extracted rules:")
+                lines.append("\n📝 Sample extracted rules:")
                 for i, rule in enumerate(rules[:3]):
-                    click.echo(f"   {i+1}. {rule.original_text[:80]}...")
-                    click.echo(f"      Planet: {rule.conditions.planet}, House: {rule.conditions.house}")
-                    click.echo(f"      Effects: {len(rule.effects)}, Confidence: {rule.confidence_score:.2f}")
+                    lines.append(f"   {i+1}. {rule.original_text[:80]}...")
+                    lines.append(f"      Planet: {rule.conditions.planet}, House: {rule.conditions.house}")
+                    lines.append(f"      Effects: {len(rule.effects)}, Confidence: {rule.confidence_score:.2f}")
+                
+                click.echo('\n'.join(lines))
         
         # Save results if requested
         if output:
             output_data = {
                 'filename': result.filename,
                 'processed_at': datetime.now().isoformat(),
-                'total_sentences': len(result.sentences),
-                'astrological_sentences': len(result.astrological_sentences),
-                'sample_sentences': result.astrological_sentences[:10]
+                'total_sentences': n_total,
+                'astrological_sentences': n_astro,
+                'sample_sentences': astro[:10]
             }
             
             if extract_rules:
                 output_data['extracted_rules'] = len(rules)
-                output_data['stored_rules'] = stored_count if 'stored_count' in locals() else 0
+                output_data['stored_rules'] = stored_count
+            
+            from .knowledge_base import dumps_json
             
-            with open(output, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(dumps_json(output_data, indent=True))
             
             click.echo(f"💾 Results saved to: {output}")
         
@@ -145,13 +203,162 @@ def process_book(pdf_path, source_title, author, authority, extract_rules, show_
         click.echo(f"❌ Error processing book: {e}")
 
 
+# Rules per store_rules_batch call when batch processing a directory
+_STORE_BATCH_SIZE = 1000
+
+
+def _iter_pdfs(directory):
+    """
+    Yield paths of the PDF files in a directory as they are listed
+    
+    Uses os.scandir so entries are filtered on name and cached file type
+    without a stat per entry or materializing the whole listing.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.pdf') and entry.is_file():
+                yield entry.path
+
+
+def _prefetch_file(path):
+    """
+    Ask the kernel to start reading a file into the page cache
+    
+    Issues POSIX_FADV_WILLNEED so reads for queued files are in flight
+    while the first workers parse. No-op where posix_fadvise is
+    unavailable (macOS, Windows).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        # Purely advisory; the worker will report real read errors
+        pass
+
+
+def _init_worker():
+    """Build the per-process processor and extractor when a worker starts"""
+    # Workers share the parent's terminal, where their per-document prints
+    # would break up the progress bar; the bar and the summary already
+    # report each file, so worker stdout is discarded
+    sys.stdout = open(os.devnull, 'w')
+    
+    _get_processor().warm_up()
+    _get_extractor()
+
+
+def _process_one(pdf_path, authority, extract_rules, use_cache=True):
+    """
+    Process a single PDF in a worker process
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor.
+    Each worker reuses its processor and extractor, and so the extractor's
+    sentence cache, across tasks.
+    Failures are returned as a message rather than raised, since parser
+    exceptions do not always survive pickling back to the parent.
+    
+    Returns:
+        Tuple of (filename, astrological sentence count, extracted rules, error)
+    """
+    from .data_models import SourceInfo
+    
+    try:
+        processor = _get_processor()
+        result = processor.process_document(pdf_path)
+        
+        rules = []
+        if extract_rules and result.astrological_sentences:
+            source_info = SourceInfo(
+                title=Path(pdf_path).stem,
+                authority_level=_authority_map()[authority]
+            )
+            
+            extractor = _get_extractor()
+            rules = extractor.extract_rules_from_sentences(
+                result.astrological_sentences,
+                source_info,
+                use_cache=use_cache
+            )
+        
+        return result.filename, len(result.astrological_sentences), rules, None
+    
+    except Exception as e:
+        return os.path.basename(pdf_path), 0, [], str(e)
+
+
+def _process_chunk(pdf_paths, authority, extract_rules, use_cache=True):
+    """
+    Process several PDFs in one worker task
+    
+    Amortizes the per-task pickling and queue round trip over the chunk.
+    
+    Returns:
+        List of _process_one results, in order
+    """
+    return [_process_one(pdf_path, authority, extract_rules, use_cache) for pdf_path in pdf_paths]
+
+
+def _run_batch(directory, authority, extract_rules, workers, chunksize, use_cache):
+    """
+    Process the PDFs in a directory on a worker pool
+    
+    Yields one _process_one result per file as files finish.
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    
+    # Bound the tasks in flight so listing and readahead stay just ahead of
+    # the workers instead of queueing (and prefetching) the whole directory
+    max_in_flight = 2 * workers
+    pdf_paths = _iter_pdfs(directory)
+    pending = {}
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(itertools.islice(pdf_paths, chunksize))
+                if not chunk:
+                    break
+                
+                for pdf_path in chunk:
+                    _prefetch_file(pdf_path)
+                pending[executor.submit(_process_chunk, chunk, authority, extract_rules, use_cache)] = chunk
+            
+            if not pending:
+                break
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                chunk = pending.pop(future)
+                
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. a broken pool)
+                    results = [(os.path.basename(pdf_path), 0, [], str(e)) for pdf_path in chunk]
+                
+                yield from results
+
+
 @cli.command()
 @click.argument('directory', type=click.Path(exists=True), required=False)
 @click.option('--authority', '-l',
-              type=click.Choice(['classical', 'traditional', 'modern', 'commentary']),
+              type=_AUTHORITY_CHOICE,
               default='modern', help='Default authority level for all books')
 @click.option('--extract-rules', '-r', is_flag=True, help='Extract and store rules')
-def batch_process(directory, authority, extract_rules):
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=os.cpu_count() or 1,
+              help='Number of worker processes (defaults to CPU count)')
+@click.option('--chunksize', type=click.IntRange(min=1), default=1,
+              help='PDFs handed to a worker per task (raise for many small files)')
+@click.option('--no-cache', is_flag=True, help='Re-extract every sentence instead of reusing cached rules')
+@click.pass_context
+def batch_process(ctx, directory, authority, extract_rules, workers, chunksize, no_cache):
     """Process all PDFs in a directory (uses books directory from config if not specified)"""
     
     # Use configured books directory if none specified
@@ -159,58 +366,52 @@ def batch_process(directory, authority, extract_rules):
         directory = str(get_books_dir())
         click.echo(f"📁 Using configured books directory: {directory}")
     
-    pdf_files = list(Path(directory).glob("*.pdf"))
+    total_rules = 0
     
-    if not pdf_files:
-        click.echo(f"❌ No PDF files found in {directory}")
-        return
+    # Per-file (filename, sentence count, rule count, error) for the summary
+    rows = []
     
-    click.echo(f"📚 Found {len(pdf_files)} PDF files")
+    # Rules from finished files, written to the database in large batches
+    unstored_rules = []
     
-    processor = DocumentProcessor()
-    extractor = RuleExtractor() if extract_rules else None
-    kb = KnowledgeBase() if extract_rules else None  # Uses configuration for database path
+    results = _run_batch(directory, authority, extract_rules, workers, chunksize, not no_cache)
     
-    total_rules = 0
+    with click.progressbar(results, label='🔄 Processing PDFs', show_pos=True,
+                           item_show_func=lambda result: result[0] if result else None) as bar:
+        for filename, astro_count, rules, error in bar:
+            rows.append((filename, astro_count, len(rules), error))
+            unstored_rules.extend(rules)
+            
+            # Workers parse and extract; this process is the only database writer
+            if len(unstored_rules) >= _STORE_BATCH_SIZE:
+                total_rules += _knowledge_base(ctx).store_rules_batch(unstored_rules)
+                unstored_rules = []
     
-    authority_map = {
-        'classical': AuthorityLevel.CLASSICAL,
-        'traditional': AuthorityLevel.TRADITIONAL,
-        'modern': AuthorityLevel.MODERN,
-        'commentary': AuthorityLevel.COMMENTARY
-    }
+    if unstored_rules:
+        total_rules += _knowledge_base(ctx).store_rules_batch(unstored_rules)
     
-    for pdf_file in pdf_files:
-        click.echo(f"\n🔄 Processing: {pdf_file.name}")
-        
-        try:
-            # Process document
-            result = processor.process_document(str(pdf_file))
-            click.echo(f"   📊 {len(result.astrological_sentences)} astrological sentences found")
-            
-            # Extract rules if requested
-            if extract_rules and result.astrological_sentences:
-                source_info = SourceInfo(
-                    title=pdf_file.stem,
-                    authority_level=authority_map[authority]
-                )
-                
-                rules = extractor.extract_rules_from_sentences(
-                    result.astrological_sentences,
-                    source_info
-                )
-                
-                if rules:
-                    stored_count = kb.store_rules_batch(rules)
-                    total_rules += stored_count
-                    click.echo(f"   ✅ Extracted and stored {stored_count} rules")
-            
-        except Exception as e:
-            click.echo(f"   ❌ Error: {e}")
+    if not rows:
+        click.echo(f"❌ No PDF files found in {directory}")
+        return
+    
+    # One write for the whole per-file summary
+    width = max(len(row[0]) for row in rows)
+    lines = ["", f"   {'File':<{width}}  {'Sentences':>9}  {'Rules':>5}"]
+    for filename, astro_count, rule_count, error in rows:
+        if error:
+            lines.append(f"   {filename:<{width}}  ❌ {error}")
+        else:
+            lines.append(f"   {filename:<{width}}  {astro_count:>9}  {rule_count:>5}")
     
-    click.echo(f"\n📊 Batch processing complete!")
+    lines += ["", "📊 Batch processing complete!", f"📚 Processed {len(rows)} PDF files"]
     if extract_rules:
-        click.echo(f"🎯 Total rules extracted and stored: {total_rules}")
+        lines.append(f"🎯 Total rules extracted and stored: {total_rules}")
+    
+    click.echo('\n'.join(lines))
+
+
+# Rules listed per click.echo call by search-rules
+_ECHO_BATCH_RULES = 100
 
 
 @cli.command()
@@ -221,60 +422,73 @@ def batch_process(directory, authority, extract_rules):
 @click.option('--min-confidence', '-c', type=float, default=0.0, help='Minimum confidence score')
 @click.option('--limit', '-l', type=int, help='Limit number of results')
 @click.option('--export', '-e', type=click.Path(), help='Export results to JSON file')
-def search_rules(planet, house, sign, source, min_confidence, limit, export):
+@click.pass_context
+def search_rules(ctx, planet, house, sign, source, min_confidence, limit, export):
     """Search for rules in the knowledge base"""
+    from .knowledge_base import dumps_json
     
-    kb = KnowledgeBase()  # Uses configuration for database path
+    kb = _knowledge_base(ctx)
+    
+    criteria = {
+        'planet': planet,
+        'house': house,
+        'sign': sign,
+        'source': source,
+        'min_confidence': min_confidence,
+        'limit': limit
+    }
     
     try:
-        rules = kb.search_rules(
-            planet=planet,
-            house=house, 
-            sign=sign,
-            source=source,
-            min_confidence=min_confidence,
-            limit=limit
-        )
+        results_count = kb.count_search_rules(**criteria)
         
-        click.echo(f"🔍 Found {len(rules)} matching rules")
+        click.echo(f"🔍 Found {results_count} matching rules")
         
-        if rules:
+        if results_count:
             click.echo(f"\n📝 Rules:")
-            for i, rule in enumerate(rules, 1):
-                click.echo(f"\n{i}. {rule.original_text}")
-                click.echo(f"   Planet: {rule.conditions.planet}, House: {rule.conditions.house}, Sign: {rule.conditions.sign}")
-                click.echo(f"   Effects: {', '.join([e.description[:50] for e in rule.effects])}")
-                click.echo(f"   Source: {rule.source.title}")
-                click.echo(f"   Confidence: {rule.confidence_score:.2f}")
         
-        if export:
-            export_data = {
-                'search_criteria': {
+        # Display and export share one pass over the cursor, so the result
+        # set is never held in memory as a whole
+        with (open(export, 'w', encoding='utf-8') if export else contextlib.nullcontext()) as f:
+            if f:
+                search_criteria = {
                     'planet': planet,
                     'house': house,
                     'sign': sign,
                     'source': source,
                     'min_confidence': min_confidence
-                },
-                'results_count': len(rules),
-                'rules': [
-                    {
-                        'id': rule.id,
-                        'text': rule.original_text,
-                        'planet': rule.conditions.planet,
-                        'house': rule.conditions.house,
-                        'sign': rule.conditions.sign,
-                        'effects': [e.description for e in rule.effects],
-                        'source': rule.source.title,
-                        'confidence': rule.confidence_score
-                    }
-                    for rule in rules
-                ]
-            }
+                }
+                
+                f.write('{"search_criteria": ')
+                f.write(dumps_json(search_criteria))
+                f.write(f', "results_count": {results_count}, "rules": [')
             
-            with open(export, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Listing lines, echoed in blocks rather than once per line
+            lines = []
             
+            # Display needs only the export columns, so no rule objects are built
+            for i, rule in enumerate(kb.search_rules_rows(**criteria), 1):
+                lines.append(f"\n{i}. {rule['text']}")
+                lines.append(f"   Planet: {rule['planet']}, House: {rule['house']}, Sign: {rule['sign']}")
+                lines.append(f"   Effects: {', '.join([e[:50] for e in rule['effects']])}")
+                lines.append(f"   Source: {rule['source']}")
+                lines.append(f"   Confidence: {rule['confidence']:.2f}")
+                
+                if i % _ECHO_BATCH_RULES == 0:
+                    click.echo('\n'.join(lines))
+                    lines = []
+                
+                if f:
+                    if i > 1:
+                        f.write(', ')
+                    f.write(dumps_json(rule))
+            
+            if lines:
+                click.echo('\n'.join(lines))
+            
+            if f:
+                f.write(']}')
+        
+        if export:
             click.echo(f"💾 Search results exported to {export}")
         
     except Exception as e:
@@ -283,17 +497,21 @@ def search_rules(planet, house, sign, source, min_confidence, limit, export):
 
 @cli.command()
 @click.option('--output', '-o', help='Output file path (uses configured export directory if not specified)')
-def export_knowledge(output):
-    """Export all rules from the knowledge base to JSON"""
-    
+@click.option('--snapshot', is_flag=True, help='Copy the SQLite database instead of writing JSON')
+@click.pass_context
+def export_knowledge(ctx, output, snapshot):
+    """Export all rules from the knowledge base to JSON, or as a database snapshot"""
     try:
-        kb = KnowledgeBase()  # Uses configuration for database path
+        kb = _knowledge_base(ctx)
         
         # Use configured export path if not specified
         if output is None:
-            output = str(get_export_path('knowledge_export.json'))
+            output = str(get_export_path('knowledge_snapshot.db' if snapshot else 'knowledge_export.json'))
         
-        exported_path = kb.export_rules_json(output)
+        if snapshot:
+            exported_path = kb.export_db_snapshot(output)
+        else:
+            exported_path = kb.export_rules_json(output)
         
         stats = kb.get_database_stats()
         click.echo(f"✅ Exported {stats['total_rules']} rules to: {exported_path}")
@@ -303,11 +521,11 @@ def export_knowledge(output):
 
 
 @cli.command()
-def stats():
+@click.pass_context
+def stats(ctx):
     """Show knowledge base statistics"""
-    
     try:
-        kb = KnowledgeBase()  # Uses configuration for database path
+        kb = _knowledge_base(ctx)
         stats = kb.get_database_stats()
         
         click.echo("📊 Knowledge Base Statistics")
@@ -330,7 +548,8 @@ def stats():
 
 
 @cli.command()
-def test_setup():
+@click.pass_context
+def test_setup(ctx):
     """Test if the setup is working correctly"""
     
     click.echo("🧪 Testing Astrology AI setup...")
@@ -352,15 +571,18 @@ def test_setup():
     except Exception as e:
         click.echo(f"❌ Configuration error: {e}")
     
-    # Test imports
-    try:
-        import PyPDF2
-        import pdfplumber
-        import spacy
-        click.echo("✅ Required packages imported successfully")
-    except ImportError as e:
-        click.echo(f"❌ Missing package: {e}")
+    # Test imports - check each package separately so every missing one is reported
+    missing_packages = False
+    for package in ('PyPDF2', 'pdfplumber', 'spacy'):
+        try:
+            __import__(package)
+        except ImportError as e:
+            click.echo(f"❌ Missing package: {e}")
+            missing_packages = True
+    
+    if missing_packages:
         return
+    click.echo("✅ Required packages imported successfully")
     
     # Test directories using configuration
     try:
@@ -380,21 +602,21 @@ def test_setup():
                 ('Charts', Path('data/charts'))
             ]
         
+        # A single mkdir both creates a missing directory and detects an existing one
         for name, dir_path in required_dirs:
-            if dir_path.exists():
+            try:
+                dir_path.mkdir(parents=True)
+                click.echo(f"✅ Created missing {name} directory: {dir_path}")
+            except FileExistsError:
                 click.echo(f"✅ {name} directory exists: {dir_path}")
-            else:
-                click.echo(f"❌ {name} directory missing: {dir_path}")
-                dir_path.mkdir(parents=True, exist_ok=True)
-                click.echo(f"✅ Created {name} directory: {dir_path}")
     except Exception as e:
         click.echo(f"❌ Directory setup error: {e}")
     
     # Test components
     try:
-        processor = DocumentProcessor()
-        extractor = RuleExtractor()
-        kb = KnowledgeBase()  # Uses configuration for database path
+        processor = _get_processor()
+        extractor = _get_extractor()
+        kb = _knowledge_base(ctx)
         click.echo("✅ All components initialized successfully")
     except Exception as e:
         click.echo(f"❌ Component initialization error: {e}")
@@ -3,28 +3,404 @@
 Document processor for extracting text from astrology PDFs
 """
 
-try:
-     import PyPDF2
-except ImportError:
-    print("Installing PyPDF2...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "PyPDF2"])
-    import PyPDF2
-
+import functools
+import itertools
+import mmap
 import re
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+
+def _import_pypdf2():
+    """Import PyPDF2 on first extraction so importing this module stays cheap"""
+    try:
+        import PyPDF2
+    except ImportError:
+        raise ImportError(
+            "PDF text extraction needs PyPDF2 (or pypdfium2); "
+            "install it with: pip install -r requirements.txt"
+        ) from None
+    
+    return PyPDF2
+
+
+def _import_pdfium():
+    """Import pypdfium2 if it is installed, otherwise None and PyPDF2 is used"""
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    
+    return pypdfium2
+
+
+def _import_pyarrow():
+    """Import pyarrow with its compute kernels if installed, otherwise None"""
+    try:
+        import pyarrow.compute
+    except ImportError:
+        return None
+    
+    return pyarrow
+
+
+# Fewest pages extract_text gives one worker process; smaller ranges do not
+# repay the process startup and the extra parse of the file
+PARALLEL_MIN_PAGES = 32
+
+
+def _open_pdf(file):
+    """Memory-map an open PDF file, so PyPDF2's many small reads skip read() calls"""
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _count_pages(pdf_path: str) -> int:
+    """Get the number of pages in a PDF"""
+    pdfium = _import_pdfium()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    PyPDF2 = _import_pypdf2()
+    
+    with open(pdf_path, 'rb') as file, _open_pdf(file) as mapped:
+        return len(PyPDF2.PdfReader(mapped).pages)
+
+
+def _iter_page_range(pdf_path: str, start: int = 0, stop: int = None) -> Iterator[str]:
+    """
+    Yield the text of pages start up to stop (default: the last page) in order
+    
+    Uses PDFium through pypdfium2 when it is installed, which extracts text
+    several times faster than pure-Python PyPDF2.
+    """
+    pdfium = _import_pdfium()
+    if pdfium is not None:
+        yield from _iter_pdfium_pages(pdfium, pdf_path, start, stop)
+        return
+    
+    PyPDF2 = _import_pypdf2()
+    
+    with open(pdf_path, 'rb') as file, _open_pdf(file) as mapped:
+        pages = PyPDF2.PdfReader(mapped).pages
+        for index in range(start, len(pages) if stop is None else stop):
+            yield pages[index].extract_text()
+
+
+def _iter_pdfium_pages(pdfium, pdf_path: str, start: int, stop: int) -> Iterator[str]:
+    """Yield page texts like _iter_page_range, read with pypdfium2"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    
+    try:
+        for index in range(start, len(pdf) if stop is None else stop):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            
+            # PDFium ends lines with CRLF; match PyPDF2's line breaks
+            yield textpage.get_text_range().replace('\r\n', '\n')
+            
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+
+def _extract_page_range(pdf_path: str, start: int = 0, stop: int = None) -> str:
+    """
+    Extract pages start up to stop as one string, one line break per page
+    
+    Kept at module level so extract_text's worker processes can run it.
+    """
+    return "".join(page_text + "\n" for page_text in _iter_page_range(pdf_path, start, stop))
+
+
+# Substitution stages used by DocumentProcessor.clean_text, in application order
+
+# Common word combinations
+COMMON_COMBINATIONS = [
+    (r'(?i)\bto\s*the\b', 'to the'),
+    (r'(?i)\bin\s*the\b', 'in the'),
+    (r'(?i)\bof\s*the\b', 'of the'),
+    (r'(?i)\bby\s*the\b', 'by the'),
+    (r'(?i)\bwith\s*the\b', 'with the'),
+    (r'(?i)\bfrom\s*the\b', 'from the'),
+    (r'(?i)\bglory\s*to\b', 'glory to'),
+    (r'(?i)\bgives\s*up\b', 'gives up'),
+    (r'(?i)\baspected\s*by\b', 'aspected by'),
+    (r'(?i)\bplaced\s*in\b', 'placed in'),
+    (r'(?i)\bresults\s*in\b', 'results in'),
+    (r'(?i)\bleads\s*to\b', 'leads to'),
+    (r'(?i)\bif\s*the\b', 'if the'),
+    (r'(?i)\bthen\s*the\b', 'then the'),
+    (r'(?i)\band\s*the\b', 'and the'),
+    (r'(?i)\blike\s*the\b', 'like the')
+]
+
+# Split words aggressively
+WORD_SPLIT_PATTERNS = [
+    (r'([a-z])([A-Z])', r'\1 \2'),  # camelCase
+    (r'([A-Za-z])([0-9])', r'\1 \2'),  # letters and numbers
+    (r'([0-9])([A-Za-z])', r'\1 \2'),  # numbers and letters
+    (r'([a-z])([A-Z][a-z])', r'\1 \2'),  # wordWord
+    (r'([A-Z][a-z])([A-Z])', r'\1 \2')  # WordWORD
+]
+
+# First pass: Fix verb-noun and noun-verb combinations
+VERB_NOUN_PATTERNS = [
+    (r'(?i)Moonis', 'Moon is'),
+    (r'(?i)Marsis', 'Mars is'),
+    (r'(?i)Jupiteris', 'Jupiter is'),
+    (r'(?i)Saturnis', 'Saturn is'),
+    (r'(?i)should\s*be', 'should be'),
+    (r'(?i)be\s*aspected', 'be aspected'),
+    (r'(?i)produces\s*blood', 'produces blood'),
+    (r'(?i)produces\s*bile', 'produces bile'),
+    (r'(?i)gives\s*up', 'gives up'),
+    (r'(?i)water\s*produces', 'water produces'),
+    (r'(?i)fire\s*produces', 'fire produces')
+]
+
+# Second pass: Fix common phrases and compounds
+PHRASE_PATTERNS = [
+    (r'(?i)Glory\s*to\s*the', 'Glory to the'),
+    (r'(?i)whose\s*very\s*breathing', 'whose very breathing'),
+    (r'(?i)this\s*world', 'this world'),
+    (r'(?i)water\s*and', 'water and'),
+    (r'(?i)blood\s*and', 'blood and'),
+    (r'(?i)her\s*home', 'her home'),
+    (r'(?i)that\s*time', 'that time'),
+    (r'(?i)at\s*that', 'at that'),
+    (r'(?i)in\s*upachaya', 'in upachaya'),
+    (r'(?i)so\s*that\s*the', 'so that the'),
+    (r'(?i)inter\s*course', 'intercourse')
+]
+
+# Third pass: Fix word boundaries with common words
+BOUNDARY_PATTERNS = [
+    # Articles and determiners
+    (r'(?i)\b(the|an?|this|that|these|those)([a-z])', r'\1 \2'),
+    # Prepositions
+    (r'(?i)\b(in|on|at|by|to|for|with|from|of|as)([a-z])', r'\1 \2'),
+    # Conjunctions
+    (r'(?i)\b(and|or|but|nor|yet|so|if|then|when|while|where)([a-z])', r'\1 \2'),
+    # Verbs
+    (r'(?i)\b(is|are|was|were|be|been|being|has|have|had)([a-z])', r'\1 \2'),
+    (r'(?i)\b(do|does|did|will|would|shall|should|may|might|must)([a-z])', r'\1 \2'),
+    (r'(?i)\b(gives|produces|causes|makes|brings|leads|results)([a-z])', r'\1 \2'),
+    # Planets and signs
+    (r'(?i)\b(sun|moon|mars|mercury|jupiter|venus|saturn|rahu|ketu)([a-z])', r'\1 \2'),
+    # Astrological terms
+    (r'(?i)\b(house|sign|aspect|planet|degree|conjunction|opposition|trine|square)([a-z])', r'\1 \2')
+]
+
+# Fourth pass: Handle special cases
+SPECIAL_CASE_PATTERNS = [
+    (r'([a-z])([A-Z])', r'\1 \2'),  # camelCase
+    (r'([A-Z])([A-Z][a-z])', r'\1 \2'),  # ABCdef
+    (r'([a-z])([0-9])', r'\1 \2'),  # word123
+    (r'([0-9])([a-z])', r'\1 \2')  # 123word
+]
+
+# Common astrological terms and their OCR/Sanskrit variants
+ASTRO_TERMS = {
+    'Sun': ['sun', 'sungod', 'sunis', 'sunin', 'surya'],
+    'Moon': ['moon', 'moonis', 'moonin', 'chandra'],
+    'Mars': ['mars', 'marsis', 'marsin', 'mangal', 'kuja'],
+    'Mercury': ['mercury', 'mercuryis', 'mercuryin', 'budha'],
+    'Jupiter': ['jupiter', 'jupiteris', 'jupiterin', 'guru', 'brihaspati'],
+    'Venus': ['venus', 'venusis', 'venusin', 'shukra'],
+    'Saturn': ['saturn', 'saturnis', 'saturnin', 'shani'],
+    'Rahu': ['rahu', 'rahuis', 'rahuin'],
+    'Ketu': ['ketu', 'ketuis', 'ketuin']
+}
+
+# Keywords identifying astrological content, by category; immutable because
+# every DocumentProcessor shares them
+ASTRO_KEYWORDS = {
+    'planets': ('sun', 'moon', 'mars', 'mercury', 'jupiter', 'venus', 'saturn', 'rahu', 'ketu'),
+    'houses': ('house', '1st house', '2nd house', '3rd house', '4th house', '5th house', 
+               '6th house', '7th house', '8th house', '9th house', '10th house', '11th house', '12th house'),
+    'signs': ('aries', 'taurus', 'gemini', 'cancer', 'leo', 'virgo', 'libra', 
+              'scorpio', 'sagittarius', 'capricorn', 'aquarius', 'pisces'),
+    'effects': ('gives', 'causes', 'indicates', 'brings', 'results in', 'leads to', 'produces')
+}
+
+# Most sentences whose astrological-content check is remembered
+DETECTION_CACHE_SIZE = 100000
+
+# Sentences classified per batch when splitting a document, and the fewest
+# that identify_astrological_content hands to pyarrow when it is installed
+CLASSIFY_BATCH_SIZE = 10000
+ARROW_MIN_SENTENCES = 1000
+
+# Text between sentence terminators, at least as long as the shortest kept
+# sentence. Matching whole runs skips shorter fragments inside the regex engine
+SENTENCE_SPANS = re.compile(r'[^.!?]{10,}')
+
+
+@functools.lru_cache(maxsize=1)
+def _clean_patterns():
+    """Compile the clean_text substitution stages once, shared by all processors"""
+    
+    def compile_all(pairs):
+        return [(re.compile(pattern), replacement) for pattern, replacement in pairs]
+    
+    words = (
+        [(r'\s+', ' ')]  # Initial whitespace normalization
+        + COMMON_COMBINATIONS
+        + WORD_SPLIT_PATTERNS
+        + VERB_NOUN_PATTERNS
+        + PHRASE_PATTERNS
+        + BOUNDARY_PATTERNS
+        + SPECIAL_CASE_PATTERNS
+        + [(r'\s+', ' ')]  # normalize spaces
+    )
+    
+    terms = (
+        # Join single letters that should be together (like 's a' -> 'sa')
+        [(r'\b([A-Za-z])\s([A-Za-z])\b(?!\s*[A-Za-z])', r'\1\2')]
+        + [(f"(?i)({'|'.join(_reachable_alternatives(variants))})", proper)
+           for proper, variants in ASTRO_TERMS.items()]
+        + [
+            # Fix spacing around punctuation
+            (r'([.,;!?])(?!\s)', r'\1 '),  # Add space after punctuation
+            (r'\s+([.,;!?])', r'\1'),  # Remove space before punctuation
+            # Fix spacing around quotes and parentheses
+            (r'(["\(])\s*', r'\1'),
+            (r'\s*(["\)])', r'\1'),
+            # Fix specific patterns
+            (r'(?i)\b(to|in|of|by|with|from)the\b', r'\1 the'),  # Fix merged articles
+            (r'(?i)\b(gives|results|leads|placed|aspected)\s*(up|in|to|by)\b', r'\1 \2'),  # Fix verb phrases
+            # Final cleanup
+            (r'\b(\w+)\s+\1\b', r'\1'),  # Remove repeated words
+            (r'\s+', ' ')  # Normalize whitespace
+        ]
+    )
+    
+    return {
+        # Form feeds and carriage returns become newlines, and standalone page
+        # numbers are dropped; one pass, matching numbers between any of them
+        'artifacts': compile_all([
+            (r'[\n\f\r]\d+[\n\f\r]|[\f\r]', '\n')
+        ]),
+        'words': compile_all(words),
+        'terms': compile_all(terms)
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _keyword_patterns():
+    """Compile one alternation per ASTRO_KEYWORDS category, shared by all processors"""
+    return {
+        category: re.compile('|'.join(map(re.escape, _minimal_keywords(words))))
+        for category, words in ASTRO_KEYWORDS.items()
+    }
+
+
+# Books repeat sentences (headers, tables, formulae), so detection results
+# are remembered per process, across documents
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _is_astrological(sentence: str) -> bool:
+    """Check a sentence for a planet together with a house, sign or effect keyword"""
+    sentence_lower = sentence.lower()
+    patterns = _keyword_patterns()
+    
+    # Every accepted combination needs a planet, so reject early without one
+    if not patterns['planets'].search(sentence_lower):
+        return False
+    
+    # Planet + house, planet + sign, or planet + effect keyword. Categories
+    # are searched separately: one combined alternation would consume
+    # keywords that overlap across categories ("causesun" hides "sun")
+    return bool(patterns['houses'].search(sentence_lower)
+                or patterns['signs'].search(sentence_lower)
+                or patterns['effects'].search(sentence_lower))
+
+
+def _filter_astrological_arrow(pa, sentences: List[str]) -> List[str]:
+    """
+    Keep the astrological sentences, tested by Arrow compute kernels in C
+    
+    Applies the same test as _is_astrological to the whole list at once.
+    Arrow lowercases with simple case mapping where str.lower() uses full
+    mapping, so non-ASCII sentences are rechecked in Python to keep the
+    results identical.
+    """
+    pc = pa.compute
+    patterns = _keyword_patterns()
+    
+    array = pa.array(sentences, type=pa.string())
+    lower = pc.utf8_lower(array)
+    
+    def matches(category):
+        return pc.match_substring_regex(lower, patterns[category].pattern)
+    
+    mask = pc.and_(matches('planets'),
+                   pc.or_(pc.or_(matches('houses'), matches('signs')), matches('effects')))
+    is_ascii = pc.string_is_ascii(array)
+    
+    return [
+        sentence
+        for sentence, matched, ascii_only in zip(sentences, mask.to_pylist(), is_ascii.to_pylist())
+        if (matched if ascii_only else _is_astrological(sentence))
+    ]
+
+
+def _reachable_alternatives(variants: List[str]) -> List[str]:
+    """
+    Drop literal alternatives that an earlier alternative always preempts
+    
+    An alternation takes the first alternative that matches, so a variant
+    starting with an earlier one never matches ("sunis" after "sun").
+    """
+    reachable = []
+    for variant in variants:
+        if not any(variant.startswith(earlier) for earlier in reachable):
+            reachable.append(variant)
+    return reachable
+
+
+def _minimal_keywords(words: Tuple[str, ...]) -> List[str]:
+    """
+    Drop keywords that contain a shorter keyword from the same list
+    
+    Substring matching cannot tell them apart ("7th house" never matches
+    without "house"), and a smaller alternation scans faster; a single
+    remaining keyword becomes a plain literal search.
+    """
+    return [word for word in words if not any(other != word and other in word for other in words)]
+
+
+def _sub_all(patterns, text: str) -> str:
+    """Apply compiled (pattern, replacement) pairs to text in order"""
+    for pattern, replacement in patterns:
+        text = pattern.sub(replacement, text)
+    return text
 
 
 @dataclass
 class ProcessedDocument:
-    """Container for processed document data"""
+    """
+    Container for processed document data
+    
+    extracted_text and sentences are only filled in when process_document is
+    asked to keep them (keep_text=True) and are None otherwise; sentence_count
+    is always set.
+    """
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('filename', 'total_pages', 'extracted_text', 'sentences',
+                 'astrological_sentences', 'sentence_count')
+    
     filename: str
     total_pages: int
-    extracted_text: str
-    sentences: List[str]
+    extracted_text: Optional[str]
+    sentences: Optional[List[str]]
     astrological_sentences: List[str]
+    sentence_count: int
 
 
 class DocumentProcessor:
@@ -34,252 +410,151 @@ class DocumentProcessor:
     
     def __init__(self):
         # Common astrological terms for filtering content
-        self.astro_keywords = {
-            'planets': ['sun', 'moon', 'mars', 'mercury', 'jupiter', 'venus', 'saturn', 'rahu', 'ketu'],
-            'houses': ['house', '1st house', '2nd house', '3rd house', '4th house', '5th house', 
-                      '6th house', '7th house', '8th house', '9th house', '10th house', '11th house', '12th house'],
-            'signs': ['aries', 'taurus', 'gemini', 'cancer', 'leo', 'virgo', 'libra', 
-                     'scorpio', 'sagittarius', 'capricorn', 'aquarius', 'pisces'],
-            'effects': ['gives', 'causes', 'indicates', 'brings', 'results in', 'leads to', 'produces']
-        }
-    
-    def extract_text(self, pdf_path: str) -> str:
-        """Extract text from PDF using PyPDF2"""
+        self.astro_keywords = ASTRO_KEYWORDS
+    
+    def warm_up(self):
+        """Load the PDF library and compile the cleaning patterns ahead of the first document"""
+        if _import_pdfium() is None:
+            try:
+                _import_pypdf2()
+            except ImportError:
+                # Left for extract_text to report against each document
+                pass
+        _clean_patterns()
+    
+    def extract_text(self, pdf_path: str, workers: int = 1) -> str:
+        """
+        Extract text from PDF using pypdfium2 if installed, otherwise PyPDF2
+        
+        With workers > 1, long documents are split into contiguous ranges of
+        at least PARALLEL_MIN_PAGES pages, extracted in separate processes.
+        """
         if not Path(pdf_path).exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         print(f"Extracting text from: {pdf_path}")
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+            if workers > 1:
+                total_pages = _count_pages(pdf_path)
+                workers = min(workers, total_pages // PARALLEL_MIN_PAGES)
+                if workers > 1:
+                    return self._extract_text_parallel(pdf_path, total_pages, workers)
+            
+            return _extract_page_range(pdf_path)
         except Exception as e:
             raise ValueError(f"Could not extract text from {pdf_path}: {e}")
     
+    def _extract_text_parallel(self, pdf_path: str, total_pages: int, workers: int) -> str:
+        """Extract a PDF's pages in one contiguous range per worker process"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Each worker parses the file once, so give it one large range
+        # rather than a task per page
+        step = -(-total_pages // workers)
+        starts = range(0, total_pages, step)
+        stops = [min(start + step, total_pages) for start in starts]
+        
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            return "".join(executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops))
+    
+    def iter_page_texts(self, pdf_path: str) -> Iterator[str]:
+        """Yield the text of each PDF page in order, one page at a time"""
+        return _iter_page_range(pdf_path)
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
+        patterns = _clean_patterns()
+        
         # Pre-processing: normalize characters and remove artifacts
         text = text.replace('�', '')
-        text = re.sub(r'[\f\r]', '\n', text)
-        text = re.sub(r'\n\d+\n', '\n', text)
-        text = text.replace('\t', ' ')
-        
-        # Initial whitespace normalization
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Fix common word combinations first
-        common_combinations = {
-            r'(?i)\bto\s*the\b': 'to the',
-            r'(?i)\bin\s*the\b': 'in the',
-            r'(?i)\bof\s*the\b': 'of the',
-            r'(?i)\bby\s*the\b': 'by the',
-            r'(?i)\bwith\s*the\b': 'with the',
-            r'(?i)\bfrom\s*the\b': 'from the',
-            r'(?i)\bglory\s*to\b': 'glory to',
-            r'(?i)\bgives\s*up\b': 'gives up',
-            r'(?i)\baspected\s*by\b': 'aspected by',
-            r'(?i)\bplaced\s*in\b': 'placed in',
-            r'(?i)\bresults\s*in\b': 'results in',
-            r'(?i)\bleads\s*to\b': 'leads to',
-            r'(?i)\bif\s*the\b': 'if the',
-            r'(?i)\bthen\s*the\b': 'then the',
-            r'(?i)\band\s*the\b': 'and the',
-            r'(?i)\blike\s*the\b': 'like the'
-        }
-        
-        for pattern, replacement in common_combinations.items():
-            text = re.sub(pattern, replacement, text)
-        
-        # Split words aggressively
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # camelCase
-        text = re.sub(r'([A-Za-z])([0-9])', r'\1 \2', text)  # letters and numbers
-        text = re.sub(r'([0-9])([A-Za-z])', r'\1 \2', text)  # numbers and letters
-        text = re.sub(r'([a-z])([A-Z][a-z])', r'\1 \2', text)  # wordWord
-        text = re.sub(r'([A-Z][a-z])([A-Z])', r'\1 \2', text)  # WordWORD
-        
-        # First pass: Fix verb-noun and noun-verb combinations
-        verb_noun_patterns = [
-            (r'(?i)Moonis', 'Moon is'),
-            (r'(?i)Marsis', 'Mars is'),
-            (r'(?i)Jupiteris', 'Jupiter is'),
-            (r'(?i)Saturnis', 'Saturn is'),
-            (r'(?i)should\s*be', 'should be'),
-            (r'(?i)be\s*aspected', 'be aspected'),
-            (r'(?i)produces\s*blood', 'produces blood'),
-            (r'(?i)produces\s*bile', 'produces bile'),
-            (r'(?i)gives\s*up', 'gives up'),
-            (r'(?i)water\s*produces', 'water produces'),
-            (r'(?i)fire\s*produces', 'fire produces')
-        ]
+        text = _sub_all(patterns['artifacts'], text)
         
-        for pattern, replacement in verb_noun_patterns:
-            text = re.sub(pattern, replacement, text)
-
-        # Second pass: Fix common phrases and compounds
-        phrase_patterns = [
-            (r'(?i)Glory\s*to\s*the', 'Glory to the'),
-            (r'(?i)whose\s*very\s*breathing', 'whose very breathing'),
-            (r'(?i)this\s*world', 'this world'),
-            (r'(?i)water\s*and', 'water and'),
-            (r'(?i)blood\s*and', 'blood and'),
-            (r'(?i)her\s*home', 'her home'),
-            (r'(?i)that\s*time', 'that time'),
-            (r'(?i)at\s*that', 'at that'),
-            (r'(?i)in\s*upachaya', 'in upachaya'),
-            (r'(?i)so\s*that\s*the', 'so that the'),
-            (r'(?i)inter\s*course', 'intercourse')
-        ]
-        
-        for pattern, replacement in phrase_patterns:
-            text = re.sub(pattern, replacement, text)
-
-        # Third pass: Fix word boundaries with common words
-        boundary_patterns = [
-            # Articles and determiners
-            (r'(?i)\b(the|an?|this|that|these|those)([a-z])', r'\1 \2'),
-            # Prepositions
-            (r'(?i)\b(in|on|at|by|to|for|with|from|of|as)([a-z])', r'\1 \2'),
-            # Conjunctions
-            (r'(?i)\b(and|or|but|nor|yet|so|if|then|when|while|where)([a-z])', r'\1 \2'),
-            # Verbs
-            (r'(?i)\b(is|are|was|were|be|been|being|has|have|had)([a-z])', r'\1 \2'),
-            (r'(?i)\b(do|does|did|will|would|shall|should|may|might|must)([a-z])', r'\1 \2'),
-            (r'(?i)\b(gives|produces|causes|makes|brings|leads|results)([a-z])', r'\1 \2'),
-            # Planets and signs
-            (r'(?i)\b(sun|moon|mars|mercury|jupiter|venus|saturn|rahu|ketu)([a-z])', r'\1 \2'),
-            # Astrological terms
-            (r'(?i)\b(house|sign|aspect|planet|degree|conjunction|opposition|trine|square)([a-z])', r'\1 \2')
-        ]
-        
-        for pattern, replacement in boundary_patterns:
-            text = re.sub(pattern, replacement, text)
-
-        # Fourth pass: Handle special cases
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # camelCase
-        text = re.sub(r'([A-Z])([A-Z][a-z])', r'\1 \2', text)  # ABCdef
-        text = re.sub(r'([a-z])([0-9])', r'\1 \2', text)  # word123
-        text = re.sub(r'([0-9])([a-z])', r'\1 \2', text)  # 123word
-
-        # Final cleanup
-        text = re.sub(r'\s+', ' ', text)  # normalize spaces
+        # Whitespace (tabs included), word combinations, word splitting and boundary fixes
+        text = _sub_all(patterns['words'], text)
         text = text.strip()
         
-        # Join single letters that should be together (like 's a' -> 'sa')
-        text = re.sub(r'\b([A-Za-z])\s([A-Za-z])\b(?!\s*[A-Za-z])', r'\1\2', text)
-        
-        # Fix common astrological terms
-        astro_terms = {
-            'Sun': ['sun', 'sungod', 'sunis', 'sunin', 'surya'],
-            'Moon': ['moon', 'moonis', 'moonin', 'chandra'],
-            'Mars': ['mars', 'marsis', 'marsin', 'mangal', 'kuja'],
-            'Mercury': ['mercury', 'mercuryis', 'mercuryin', 'budha'],
-            'Jupiter': ['jupiter', 'jupiteris', 'jupiterin', 'guru', 'brihaspati'],
-            'Venus': ['venus', 'venusis', 'venusin', 'shukra'],
-            'Saturn': ['saturn', 'saturnis', 'saturnin', 'shani'],
-            'Rahu': ['rahu', 'rahuis', 'rahuin'],
-            'Ketu': ['ketu', 'ketuis', 'ketuin']
-        }
-        
-        for proper, variants in astro_terms.items():
-            pattern = f"(?i)({'|'.join(variants)})"
-            text = re.sub(pattern, proper, text)
-        
-        # Fix common prepositions, articles and verbs
-        common_words = [
-            # Prepositions
-            'in', 'of', 'with', 'by', 'at', 'on', 'to', 'for', 'from', 'into',
-            # Articles
-            'the', 'a', 'an',
-            # Conjunctions
-            'and', 'or', 'but', 'if', 'when', 'while', 'because', 'that',
-            # Verbs
-            'is', 'are', 'was', 'were', 'will', 'shall', 'has', 'have', 'had',
-            'gives', 'causes', 'makes', 'brings', 'leads', 'results', 'produces',
-            'indicates', 'signifies', 'denotes', 'shows', 'suggests'
-        ]
-        
-        # Build pattern for word boundaries
-        pattern = f"(?i)\\b({'|'.join(common_words)})\\b([a-z])"
-        text = re.sub(pattern, r'\1 \2', text)
-        
-        # Fix spacing around punctuation
-        text = re.sub(r'([.,;!?])(?!\s)', r'\1 ', text)  # Add space after punctuation
-        text = re.sub(r'\s+([.,;!?])', r'\1', text)  # Remove space before punctuation
-        
-        # Fix spacing around quotes and parentheses
-        text = re.sub(r'(["\(])\s*', r'\1', text)
-        text = re.sub(r'\s*(["\)])', r'\1', text)
-        
-        # Fix specific patterns
-        text = re.sub(r'(?i)\b(to|in|of|by|with|from)the\b', r'\1 the', text)  # Fix merged articles
-        text = re.sub(r'(?i)\b(gives|results|leads|placed|aspected)\s*(up|in|to|by)\b', r'\1 \2', text)  # Fix verb phrases
-        
-        # Final cleanup
-        text = re.sub(r'\b(\w+)\s+\1\b', r'\1', text)  # Remove repeated words
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+        # Astrological terms, punctuation and final cleanup
+        text = _sub_all(patterns['terms'], text)
         text = text.strip()
         
         return text
     
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        Yield the stripped sentences of text that are a usable length
+        
+        Scans text in place rather than splitting it, so no list of every
+        fragment is built and fragments too short to keep are never copied.
+        """
+        for span in SENTENCE_SPANS.finditer(text):
+            sentence = span.group().strip()
+            if 10 <= len(sentence) <= 500:
+                yield sentence
+    
     def chunk_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences for easier processing"""
-        sentences = re.split(r'[.!?]+', text)
-        clean_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if 10 <= len(sentence) <= 500:
-                clean_sentences.append(sentence)
-        return clean_sentences
+        return list(self._iter_sentences(text))
+    
+    def count_and_classify(self, text: str) -> Tuple[int, List[str]]:
+        """
+        Count the sentences in text and pick out the astrological ones in one pass
+        
+        Sentences are classified in batches of CLASSIFY_BATCH_SIZE; only the
+        astrological ones are kept, the rest are counted and dropped.
+        """
+        sentence_count = 0
+        astro_sentences = []
+        sentences = self._iter_sentences(text)
+        
+        for batch in iter(lambda: list(itertools.islice(sentences, CLASSIFY_BATCH_SIZE)), []):
+            sentence_count += len(batch)
+            astro_sentences.extend(self.identify_astrological_content(batch))
+        
+        return sentence_count, astro_sentences
     
     def contains_astrological_content(self, sentence: str) -> bool:
         """Check if a sentence contains astrological content"""
-        sentence_lower = sentence.lower()
-        
-        # Check for planet + house combinations
-        for planet in self.astro_keywords['planets']:
-            if planet in sentence_lower:
-                for house_term in self.astro_keywords['houses']:
-                    if house_term in sentence_lower:
-                        return True
-        
-        # Check for planet + sign combinations
-        for planet in self.astro_keywords['planets']:
-            if planet in sentence_lower:
-                for sign in self.astro_keywords['signs']:
-                    if sign in sentence_lower:
-                        return True
-        
-        # Check for effect keywords
-        for effect in self.astro_keywords['effects']:
-            if effect in sentence_lower and any(planet in sentence_lower for planet in self.astro_keywords['planets']):
-                return True
-        
-        return False
+        return _is_astrological(sentence)
     
     def identify_astrological_content(self, sentences: List[str]) -> List[str]:
-        """Filter sentences to keep only those with astrological content"""
+        """
+        Filter sentences to keep only those with astrological content
+        
+        Large lists are tested in one vectorized pass when pyarrow is installed.
+        """
+        if len(sentences) >= ARROW_MIN_SENTENCES:
+            pa = _import_pyarrow()
+            if pa is not None:
+                return _filter_astrological_arrow(pa, sentences)
+        
         return [sentence for sentence in sentences if self.contains_astrological_content(sentence)]
     
-    def process_document(self, pdf_path: str) -> ProcessedDocument:
-        """Complete document processing pipeline"""
+    def process_document(self, pdf_path: str, workers: int = 1, keep_text: bool = False) -> ProcessedDocument:
+        """
+        Complete document processing pipeline
+        
+        With keep_text the cleaned text and the full sentence list are kept on
+        the result as well; by default only the astrological sentences are.
+        """
         print(f"Processing document: {pdf_path}")
         
-        # Extract and clean text
-        raw_text = self.extract_text(pdf_path)
-        clean_text = self.clean_text(raw_text)
+        # Extract and clean text; the raw text is not kept past cleaning
+        clean_text = self.clean_text(self.extract_text(pdf_path, workers))
         
-        # Split into sentences and find astrological content
-        sentences = self.chunk_into_sentences(clean_text)
-        astro_sentences = self.identify_astrological_content(sentences)
+        if keep_text:
+            sentences = self.chunk_into_sentences(clean_text)
+            sentence_count = len(sentences)
+            astro_sentences = self.identify_astrological_content(sentences)
+        else:
+            # Count sentences and keep only the astrological ones
+            sentence_count, astro_sentences = self.count_and_classify(clean_text)
+            clean_text = sentences = None
         
         filename = Path(pdf_path).name
         
         print(f"✅ Processed {filename}:")
-        print(f"   Total sentences: {len(sentences)}")
+        print(f"   Total sentences: {sentence_count}")
         print(f"   Astrological sentences: {len(astro_sentences)}")
         
         return ProcessedDocument(
@@ -287,7 +562,8 @@ class DocumentProcessor:
             total_pages=0,
             extracted_text=clean_text,
             sentences=sentences,
-            astrological_sentences=astro_sentences
+            astrological_sentences=astro_sentences,
+            sentence_count=sentence_count
         )
 
 
@@ -37,6 +37,10 @@ except ImportError:
 @dataclass
 class InterpretationResult:
     """Result of chart interpretation"""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('birth_data', 'planetary_analysis', 'house_analysis', 'yoga_analysis',
+                 'overall_summary', 'confidence_score', 'sources_used')
+    
     birth_data: Dict[str, Any]
     planetary_analysis: List[Dict[str, Any]]
     house_analysis: List[Dict[str, Any]]
@@ -49,6 +53,9 @@ class InterpretationResult:
 @dataclass
 class RuleMatch:
     """Represents a rule that matches chart conditions"""
+    __slots__ = ('rule_id', 'rule_text', 'match_confidence', 'chart_conditions',
+                 'predicted_effects', 'source_authority')
+    
     rule_id: str
     rule_text: str
     match_confidence: float
@@ -6,9 +6,9 @@ Knowledge base system for storing and retrieving astrological rules
 import json
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
-from .data_models import AstrologicalRule, AstrologicalCondition, SourceInfo, AuthorityLevel
+from .data_models import AstrologicalRule, AstrologicalCondition, AstrologicalEffect, SourceInfo, AuthorityLevel
 
 # Import configuration system
 import sys
@@ -25,6 +25,24 @@ except ImportError:
     def get_export_path(filename: str) -> Path:
         return Path("data") / filename
 
+# Use orjson for exports and the JSON columns when it is installed; it is
+# several times faster
+try:
+    import orjson
+    
+    def dumps_json(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (orjson backend)"""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (stdlib backend)"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    
+    loads_json = json.loads
+
 
 class KnowledgeBase:
     """
@@ -44,15 +62,72 @@ class KnowledgeBase:
         else:
             self.db_path = str(get_database_path())
         
+        self._conn = None
         self.ensure_database_exists()
     
+    # Settings applied to every connection; journal_mode=WAL persists in the
+    # database file, so ensure_database_exists sets it once instead
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",  # WAL keeps NORMAL safe against corruption
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",  # Read pages through a 256 MB memory map
+        "PRAGMA cache_size=-65536"  # 64 MB page cache
+    )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the knowledge base's connection, opening it on first use
+        
+        The connection lives as long as the instance, so repeated queries
+        are served from SQLite's prepared statement cache instead of being
+        parsed again. "with" blocks on it commit or roll back but leave it open.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            
+            for pragma in self._CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            
+            conn.row_factory = sqlite3.Row
+            self._conn = conn
+        
+        return self._conn
+    
+    def close(self):
+        """Close the database connection; the next query reopens it"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    # Secondary indexes on rules, by name; the composites cover the filter
+    # combinations the CLI and get_conflicting_rules issue, and
+    # idx_rules_conf_auth matches the search ORDER BY so limited and
+    # min_confidence searches read rows in order instead of sorting
+    _RULE_INDEXES = {
+        'idx_rules_planet': "planet",
+        'idx_rules_house': "house",
+        'idx_rules_sign': "sign",
+        'idx_rules_source': "source_title",
+        'idx_rules_planet_house_sign': "planet, house, sign",
+        'idx_rules_source_conf': "source_title, confidence_score",
+        'idx_rules_conf_auth': "confidence_score DESC, authority_level"
+    }
+    
+    def _create_rule_indexes(self, conn: sqlite3.Connection):
+        """Create any of the rules indexes that are missing"""
+        for name, columns in self._RULE_INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON rules({columns})")
+    
     def ensure_database_exists(self):
         """Create database and tables if they don't exist"""
         
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL persists in the database file, so set it once here
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS rules (
                     id TEXT PRIMARY KEY,
@@ -74,22 +149,49 @@ class KnowledgeBase:
                 )
             """)
             
+            # idx_rules_planet_house_sign serves everything this one did
+            conn.execute("DROP INDEX IF EXISTS idx_rules_planet_house")
+            self._create_rule_indexes(conn)
+            
+            tables = {row['name'] for row in
+                      conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            
+            # One row per (rule, tag) so get_rules_by_tag is an index probe
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rules_planet ON rules(planet);
+                CREATE TABLE IF NOT EXISTS rule_tags (
+                    rule_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (rule_id, tag)
+                )
             """)
             
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rules_house ON rules(house);
+                CREATE INDEX IF NOT EXISTS idx_rule_tags_tag ON rule_tags(tag);
             """)
             
+            if 'rule_tags' not in tables:
+                # Index the tags of rules stored before rule_tags existed
+                self._replace_tags(conn, self._legacy_tags(conn))
+            
+            # One row per (rule, effect category, polarity) so
+            # get_conflicting_rules can match opposite effects in SQL
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rules_sign ON rules(sign);
+                CREATE TABLE IF NOT EXISTS rule_effects (
+                    rule_id TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    positive INTEGER NOT NULL,
+                    PRIMARY KEY (rule_id, category, positive)
+                )
             """)
             
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rules_source ON rules(source_title);
+                CREATE INDEX IF NOT EXISTS idx_rule_effects_category ON rule_effects(category, positive);
             """)
             
+            if 'rule_effects' not in tables:
+                # Index the effects of rules stored before rule_effects existed
+                self._replace_effects(conn, self._legacy_effects(conn))
+            
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS astrological_rules (
                     id TEXT PRIMARY KEY,
@@ -135,28 +237,78 @@ class KnowledgeBase:
             
             conn.commit()
     
-    def serialize_rule(self, rule: AstrologicalRule) -> Dict[str, Any]:
+    @staticmethod
+    def _legacy_tags(conn: sqlite3.Connection) -> Dict[str, List[str]]:
+        """
+        Get the tags of every stored rule from tags_json
+        
+        A legacy row whose tags_json doesn't decode to a list is skipped
+        rather than stopping the migration; such a rule just has no tags
+        for get_rules_by_tag to match.
+        """
+        tags_by_id = {}
+        for row in conn.execute("SELECT id, tags_json FROM rules"):
+            try:
+                tags = loads_json(row['tags_json'] or '[]')
+            except (ValueError, TypeError):
+                continue
+            if isinstance(tags, list):
+                tags_by_id[row['id']] = tags
+        return tags_by_id
+    
+    @staticmethod
+    def _legacy_effects(conn: sqlite3.Connection) -> Dict[str, List[tuple]]:
+        """
+        Get the (category, positive) pairs of every stored rule from effects_json
+        
+        A legacy row whose effects_json is empty or doesn't decode is skipped
+        rather than stopping the migration; such a rule just has no effects
+        for get_conflicting_rules to match.
+        """
+        effects_by_id = {}
+        for row in conn.execute("SELECT id, effects_json FROM rules"):
+            try:
+                effects_by_id[row['id']] = [(effect['category'], effect['positive'])
+                                            for effect in loads_json(row['effects_json'] or '[]')]
+            except (ValueError, TypeError, KeyError):
+                continue
+        return effects_by_id
+    
+    # Columns of the rules table in storage order, as _rule_values returns them
+    _RULE_COLUMNS = (
+        'id', 'original_text', 'planet', 'house', 'sign', 'nakshatra',
+        'conditions_json', 'effects_json', 'source_title', 'source_author',
+        'source_page', 'authority_level', 'tags_json', 'confidence_score',
+        'created_at', 'updated_at'
+    )
+    
+    # Select list for rows that deserialize_rule unpacks
+    _RULE_SELECT = ", ".join(_RULE_COLUMNS)
+    
+    @classmethod
+    def serialize_rule(cls, rule: AstrologicalRule) -> Dict[str, Any]:
         """Convert rule object to database-ready format"""
+        return dict(zip(cls._RULE_COLUMNS, cls._rule_values(rule)))
+    
+    @staticmethod
+    def _rule_values(rule: AstrologicalRule) -> tuple:
+        """Convert rule object to a tuple of column values in _RULE_COLUMNS order"""
         
-        # Extract main condition fields for indexing
-        planet = rule.conditions.planet
-        house = rule.conditions.house
-        sign = rule.conditions.sign
-        nakshatra = rule.conditions.nakshatra
+        conditions = rule.conditions
         
         # Serialize complex fields to JSON
-        conditions_json = json.dumps({
-            'planet': rule.conditions.planet,
-            'house': rule.conditions.house,
-            'sign': rule.conditions.sign,
-            'nakshatra': rule.conditions.nakshatra,
-            'aspect': rule.conditions.aspect,
-            'conjunction': rule.conditions.conjunction,
-            'degree_range': rule.conditions.degree_range,
-            'additional_conditions': rule.conditions.additional_conditions
+        conditions_json = dumps_json({
+            'planet': conditions.planet,
+            'house': conditions.house,
+            'sign': conditions.sign,
+            'nakshatra': conditions.nakshatra,
+            'aspect': conditions.aspect,
+            'conjunction': conditions.conjunction,
+            'degree_range': conditions.degree_range,
+            'additional_conditions': conditions.additional_conditions
         })
         
-        effects_json = json.dumps([
+        effects_json = dumps_json([
             {
                 'category': effect.category,
                 'description': effect.description,
@@ -167,47 +319,59 @@ class KnowledgeBase:
             for effect in rule.effects
         ])
         
-        tags_json = json.dumps(rule.tags)
-        
-        return {
-            'id': rule.id,
-            'original_text': rule.original_text,
-            'planet': planet,
-            'house': house,
-            'sign': sign,
-            'nakshatra': nakshatra,
-            'conditions_json': conditions_json,
-            'effects_json': effects_json,
-            'source_title': rule.source.title,
-            'source_author': rule.source.author,
-            'source_page': rule.source.page_number,
-            'authority_level': rule.source.authority_level.value,
-            'tags_json': tags_json,
-            'confidence_score': rule.confidence_score,
-            'created_at': rule.created_at.isoformat(),
-            'updated_at': rule.updated_at.isoformat() if rule.updated_at else None
-        }
+        tags_json = dumps_json(rule.tags)
+        
+        # The main condition fields are stored as columns too, for indexing
+        source = rule.source
+        return (
+            rule.id,
+            rule.original_text,
+            conditions.planet,
+            conditions.house,
+            conditions.sign,
+            conditions.nakshatra,
+            conditions_json,
+            effects_json,
+            source.title,
+            source.author,
+            source.page_number,
+            source.authority_level.value,
+            tags_json,
+            rule.confidence_score,
+            rule.created_at.isoformat(),
+            rule.updated_at.isoformat() if rule.updated_at else None
+        )
     
-    def deserialize_rule(self, row: sqlite3.Row) -> AstrologicalRule:
-        """Convert database row back to rule object"""
+    @staticmethod
+    def deserialize_rule(row: tuple) -> AstrologicalRule:
+        """
+        Convert database row back to rule object
+        
+        The row holds the _RULE_COLUMNS values in order, as selected with
+        _RULE_SELECT; it is unpacked by position rather than looked up by name.
+        """
+        
+        (rule_id, original_text, _planet, _house, _sign, _nakshatra,
+         conditions_json, effects_json, source_title, source_author,
+         source_page, authority_level, tags_json, confidence_score,
+         created_at, updated_at) = row
         
         # Parse JSON fields
-        conditions_data = json.loads(row['conditions_json'])
-        effects_data = json.loads(row['effects_json'])
-        tags = json.loads(row['tags_json'])
+        conditions_data = loads_json(conditions_json)
+        effects_data = loads_json(effects_json)
+        tags = loads_json(tags_json)
         
         # Reconstruct condition object
-        from .data_models import AstrologicalCondition, AstrologicalEffect
-        
+        get = conditions_data.get
         condition = AstrologicalCondition(
-            planet=conditions_data.get('planet'),
-            house=conditions_data.get('house'),
-            sign=conditions_data.get('sign'),
-            nakshatra=conditions_data.get('nakshatra'),
-            aspect=conditions_data.get('aspect'),
-            conjunction=conditions_data.get('conjunction'),
-            degree_range=conditions_data.get('degree_range'),
-            additional_conditions=conditions_data.get('additional_conditions')
+            planet=get('planet'),
+            house=get('house'),
+            sign=get('sign'),
+            nakshatra=get('nakshatra'),
+            aspect=get('aspect'),
+            conjunction=get('conjunction'),
+            degree_range=get('degree_range'),
+            additional_conditions=get('additional_conditions')
         )
         
         # Reconstruct effects
@@ -224,80 +388,101 @@ class KnowledgeBase:
         
         # Reconstruct source
         source = SourceInfo(
-            title=row['source_title'],
-            author=row['source_author'],
-            page_number=row['source_page'],
-            authority_level=AuthorityLevel(row['authority_level'])
+            title=source_title,
+            author=source_author,
+            page_number=source_page,
+            authority_level=AuthorityLevel(authority_level)
         )
         
         # Reconstruct rule
         return AstrologicalRule(
-            id=row['id'],
-            original_text=row['original_text'],
+            id=rule_id,
+            original_text=original_text,
             conditions=condition,
             effects=effects,
             source=source,
             tags=tags,
-            confidence_score=row['confidence_score'],
-            created_at=datetime.fromisoformat(row['created_at']),
-            updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+            confidence_score=confidence_score,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None
         )
     
+    @staticmethod
+    def _execute_tuples(conn: sqlite3.Connection, sql: str, params=()) -> sqlite3.Cursor:
+        """Run sql on a cursor that yields plain tuples instead of sqlite3.Row"""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+    
     def store_rule(self, rule: AstrologicalRule) -> bool:
         """Store a single rule in the database"""
-        
-        try:
-            data = self.serialize_rule(rule)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO rules 
-                    (  planet, house, sign, nakshatra, 
-                     conditions_json, effects_json, source_title, source_author, 
-                     source_page, authority_level, tags_json, confidence_score, 
-                     created_at, updated_at)
-                    VALUES 
-                    (:id, :original_text, :planet, :house, :sign, :nakshatra,
-                     :conditions_json, :effects_json, :source_title, :source_author,
-                     :source_page, :authority_level, :tags_json, :confidence_score,
-                     :created_at, :updated_at)
-                """, data)
-                conn.commit()
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error storing rule {rule.id}: {e}")
-            return False
+        return self.store_rules_batch([rule]) == 1
     
-    def store_rules_batch(self, rules: List[AstrologicalRule]) -> int:
-        """Store multiple rules efficiently"""
+    # Upsert for one rule's _rule_values, shared by every store path
+    _INSERT_RULE_SQL = (
+        "INSERT OR REPLACE INTO rules (" + ", ".join(_RULE_COLUMNS) + ") "
+        "VALUES (" + ", ".join(["?"] * len(_RULE_COLUMNS)) + ")"
+    )
+    
+    def store_rules_batch(self, rules: List[AstrologicalRule], rebuild_indexes: bool = False) -> int:
+        """
+        Store multiple rules efficiently in a single transaction
+        
+        With rebuild_indexes the rules indexes are dropped for the insert and
+        rebuilt before commit; see bulk_load.
+        """
         
+        if not rules:
+            return 0
+        
+        insert_sql = self._INSERT_RULE_SQL
+        rules_by_id = {}
+        reported = set()
         stored_count = 0
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                for rule in rules:
-                    try:
-                        data = self.serialize_rule(rule)
-                        
-                        conn.execute("""
-                            INSERT OR REPLACE INTO rules 
-                            (id, original_text, planet, house, sign, nakshatra, 
-                             conditions_json, effects_json, source_title, source_author, 
-                             source_page, authority_level, tags_json, confidence_score, 
-                             created_at, updated_at)
-                            VALUES 
-                            (:id, :original_text, :planet, :house, :sign, :nakshatra,
-                             :conditions_json, :effects_json, :source_title, :source_author,
-                             :source_page, :authority_level, :tags_json, :confidence_score,
-                             :created_at, :updated_at)
-                        """, data)
-                        
-                        stored_count += 1
-                        
-                    except Exception as e:
-                        print(f"Error storing rule {rule.id}: {e}")
+            with self._connect() as conn:
+                # Take the write lock up front instead of upgrading mid-batch,
+                # so a concurrent writer makes this wait rather than fail
+                conn.execute("BEGIN IMMEDIATE")
+                
+                if rebuild_indexes:
+                    for name in self._RULE_INDEXES:
+                        conn.execute(f"DROP INDEX IF EXISTS {name}")
+                
+                try:
+                    # Rules are serialized as executemany consumes them
+                    cursor = conn.executemany(
+                        insert_sql, self._iter_rule_values(rules, rules_by_id, reported)
+                    )
+                    stored_count = cursor.rowcount
+                except sqlite3.Error:
+                    # Retry row by row so one bad rule doesn't drop the batch;
+                    # the rollback also restores any dropped indexes
+                    conn.rollback()
+                    conn.execute("BEGIN IMMEDIATE")
+                    serialized = {}
+                    stored_ids = set()
+                    for row in self._iter_rule_values(rules, serialized, reported):
+                        try:
+                            conn.execute(insert_sql, row)
+                            stored_count += 1
+                            stored_ids.add(row[0])
+                        except sqlite3.Error as e:
+                            print(f"Error storing rule {row[0]}: {e}")
+                    
+                    rules_by_id = {rule_id: rule for rule_id, rule in serialized.items()
+                                   if rule_id in stored_ids}
+                
+                self._replace_tags(conn, {rule_id: rule.tags
+                                          for rule_id, rule in rules_by_id.items()})
+                self._replace_effects(conn, {
+                    rule_id: [(effect.category, effect.positive) for effect in rule.effects]
+                    for rule_id, rule in rules_by_id.items()
+                })
+                
+                if rebuild_indexes:
+                    self._create_rule_indexes(conn)
                 
                 conn.commit()
         
@@ -306,12 +491,61 @@ class KnowledgeBase:
         
         return stored_count
     
+    def _iter_rule_values(self, rules: List[AstrologicalRule], rules_by_id: Dict[str, AstrologicalRule],
+                          reported: set) -> Iterator[tuple]:
+        """
+        Yield _rule_values for each rule that serializes, recording it in rules_by_id
+        
+        A rule that fails is reported once; reported holds the positions of
+        the failures already printed, so a second pass stays quiet about them.
+        """
+        for position, rule in enumerate(rules):
+            try:
+                values = self._rule_values(rule)
+            except Exception as e:
+                if position not in reported:
+                    reported.add(position)
+                    print(f"Error storing rule {rule.id}: {e}")
+                continue
+            
+            rules_by_id[rule.id] = rule
+            yield values
+    
+    def bulk_load(self, rules: List[AstrologicalRule]) -> int:
+        """
+        Store a large set of rules, building the rules indexes once at the end
+        
+        Each index is rebuilt with a single sort over the whole table instead
+        of taking one random insert per row, which pays off for initial imports
+        but not for small batches into a large table.
+        """
+        return self.store_rules_batch(rules, rebuild_indexes=True)
+    
+    @staticmethod
+    def _replace_tags(conn: sqlite3.Connection, tags_by_id: Dict[str, List[str]]):
+        """Make rule_tags hold exactly the given tags for each rule ID"""
+        conn.executemany("DELETE FROM rule_tags WHERE rule_id = ?",
+                         ((rule_id,) for rule_id in tags_by_id))
+        conn.executemany("INSERT OR IGNORE INTO rule_tags (rule_id, tag) VALUES (?, ?)",
+                         ((rule_id, tag) for rule_id, tags in tags_by_id.items() for tag in tags))
+    
+    @staticmethod
+    def _replace_effects(conn: sqlite3.Connection, effects_by_id: Dict[str, List[tuple]]):
+        """Make rule_effects hold exactly the given (category, positive) pairs for each rule ID"""
+        conn.executemany("DELETE FROM rule_effects WHERE rule_id = ?",
+                         ((rule_id,) for rule_id in effects_by_id))
+        conn.executemany("INSERT OR IGNORE INTO rule_effects (rule_id, category, positive) VALUES (?, ?, ?)",
+                         ((rule_id, category, bool(positive))
+                          for rule_id, effects in effects_by_id.items()
+                          for category, positive in effects))
+    
     def get_rule_by_id(self, rule_id: str) -> Optional[AstrologicalRule]:
         """Get a specific rule by ID"""
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM rules WHERE id = ?", (rule_id,))
+        with self._connect() as conn:
+            cursor = self._execute_tuples(
+                conn, "SELECT " + self._RULE_SELECT + " FROM rules WHERE id = ?", (rule_id,)
+            )
             row = cursor.fetchone()
             
             if row:
@@ -319,110 +553,179 @@ class KnowledgeBase:
             
             return None
     
-    def search_rules(self, planet: str = None, house: int = None, 
-                    sign: str = None, source: str = None, 
-                    min_confidence: float = 0.0, limit: int = None) -> List[AstrologicalRule]:
-        """Search rules by various criteria"""
+    # WHERE clause fragment for each search_rules filter
+    _SEARCH_CLAUSES = {
+        'planet': "planet = ?",
+        'house': "house = ?",
+        'sign': "sign = ?",
+        'source': "source_title LIKE ?",
+        'min_confidence': "confidence_score >= ?"
+    }
+    
+    # Columns search_rules_rows projects, under their export names
+    _SEARCH_ROW_COLUMNS = (
+        "id, original_text AS text, planet, house, sign, effects_json AS effects, "
+        "source_title AS source, confidence_score AS confidence"
+    )
+    
+    # (select, count, rows) SQL per combination of active filters, built on first use
+    _SEARCH_QUERIES: Dict[tuple, tuple] = {}
+    
+    @classmethod
+    def _search_query(cls, active: tuple) -> tuple:
+        """Get the (select, count, rows) search SQL for a combination of active filters"""
+        queries = cls._SEARCH_QUERIES.get(active)
+        
+        if queries is None:
+            where = ""
+            if active:
+                where = " WHERE " + " AND ".join(cls._SEARCH_CLAUSES[name] for name in active)
+            order = " ORDER BY confidence_score DESC, authority_level ASC"
+            queries = (
+                "SELECT " + cls._RULE_SELECT + " FROM rules" + where + order,
+                "SELECT COUNT(*) FROM rules" + where,
+                "SELECT " + cls._SEARCH_ROW_COLUMNS + " FROM rules" + where + order
+            )
+            cls._SEARCH_QUERIES[active] = queries
         
-        query = "SELECT * FROM rules WHERE 1=1"
-        params = []
+        return queries
+    
+    @staticmethod
+    def _search_filters(planet, house, sign, source, min_confidence) -> tuple:
+        """Get the active filter names and their parameters for a search"""
+        filters = {
+            'planet': planet or None,
+            'house': house or None,
+            'sign': sign or None,
+            'source': f"%{source}%" if source else None,
+            'min_confidence': min_confidence if min_confidence > 0 else None
+        }
+        active = tuple(name for name, value in filters.items() if value is not None)
         
-        if planet:
-            query += " AND planet = ?"
-            params.append(planet)
+        return active, [filters[name] for name in active]
+    
+    def search_rules_iter(self, planet: str = None, house: int = None, 
+                         sign: str = None, source: str = None, 
+                         min_confidence: float = 0.0, limit: int = None) -> Iterator[AstrologicalRule]:
+        """Search rules by various criteria, yielding them one at a time"""
         
-        if house:
-            query += " AND house = ?"
-            params.append(house)
+        active, params = self._search_filters(planet, house, sign, source, min_confidence)
+        query = self._search_query(active)[0]
         
-        if sign:
-            query += " AND sign = ?"
-            params.append(sign)
+        if limit:
+            # Bound rather than formatted in, so every limit shares one
+            # cached statement
+            query += " LIMIT ?"
+            params.append(limit)
         
-        if source:
-            query += " AND source_title LIKE ?"
-            params.append(f"%{source}%")
+        deserialize = self.deserialize_rule
         
-        if min_confidence > 0:
-            query += " AND confidence_score >= ?"
-            params.append(min_confidence)
+        with self._connect() as conn:
+            for row in self._execute_tuples(conn, query, params):
+                yield deserialize(row)
+    
+    def search_rules_rows(self, planet: str = None, house: int = None, 
+                          sign: str = None, source: str = None, 
+                          min_confidence: float = 0.0, limit: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Search rules by various criteria, yielding flat export dicts
+        
+        Only the summary columns are read and no rule objects are built;
+        effects are reduced to their descriptions.
+        """
         
-        query += " ORDER BY confidence_score DESC, authority_level ASC"
+        active, params = self._search_filters(planet, house, sign, source, min_confidence)
+        query = self._search_query(active)[2]
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._connect() as conn:
+            for row in conn.execute(query, params):
+                rule = dict(row)
+                rule['effects'] = [effect['description'] for effect in loads_json(rule['effects'])]
+                yield rule
+    
+    def search_rules(self, planet: str = None, house: int = None, 
+                    sign: str = None, source: str = None, 
+                    min_confidence: float = 0.0, limit: int = None) -> List[AstrologicalRule]:
+        """Search rules by various criteria"""
+        return list(self.search_rules_iter(planet, house, sign, source, min_confidence, limit))
+    
+    def count_search_rules(self, planet: str = None, house: int = None, 
+                          sign: str = None, source: str = None, 
+                          min_confidence: float = 0.0, limit: int = None) -> int:
+        """Count the rules search_rules would return for the same criteria"""
         
-        rules = []
+        active, params = self._search_filters(planet, house, sign, source, min_confidence)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            
-            for row in cursor:
-                rule = self.deserialize_rule(row)
-                rules.append(rule)
+        with self._connect() as conn:
+            count = conn.execute(self._search_query(active)[1], params).fetchone()[0]
         
-        return rules
+        # A negative LIMIT means no limit to SQLite
+        return min(count, limit) if limit and limit > 0 else count
     
     def get_rules_by_tag(self, tag: str) -> List[AstrologicalRule]:
         """Get all rules containing a specific tag"""
         
-        rules = []
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM rules")
+        with self._connect() as conn:
+            cursor = self._execute_tuples(conn, (
+                "SELECT " + self._RULE_SELECT + " FROM rules"
+                " WHERE id IN (SELECT rule_id FROM rule_tags WHERE tag = ?)"
+                " ORDER BY rowid"
+            ), (tag,))
             
-            for row in cursor:
-                tags = json.loads(row['tags_json'])
-                if tag in tags:
-                    rule = self.deserialize_rule(row)
-                    rules.append(rule)
-        
-        return rules
+            deserialize = self.deserialize_rule
+            return [deserialize(row) for row in cursor.fetchall()]
     
     def get_conflicting_rules(self, rule: AstrologicalRule) -> List[AstrologicalRule]:
         """Find rules that might conflict with the given rule"""
         
-        # Find rules with same conditions but different effects
-        matching_rules = self.search_rules(
-            planet=rule.conditions.planet,
-            house=rule.conditions.house,
-            sign=rule.conditions.sign
-        )
+        # Rules with the same conditions that have an effect of the same
+        # category but the opposite polarity
+        opposites = {(effect.category, not effect.positive) for effect in rule.effects}
+        if not opposites:
+            return []
         
-        conflicts = []
+        active, params = self._search_filters(
+            rule.conditions.planet, rule.conditions.house, rule.conditions.sign, None, 0.0
+        )
+        clauses = [self._SEARCH_CLAUSES[name] for name in active]
+        clauses.append("id != ?")
+        clauses.append(
+            "EXISTS (SELECT 1 FROM rule_effects e WHERE e.rule_id = rules.id"
+            " AND (e.category, e.positive) IN (VALUES " + ", ".join(["(?, ?)"] * len(opposites)) + "))"
+        )
+        params.append(rule.id)
+        for opposite in opposites:
+            params.extend(opposite)
         
-        for other_rule in matching_rules:
-            if other_rule.id != rule.id:
-                # Check if effects are contradictory
-                for effect in rule.effects:
-                    for other_effect in other_rule.effects:
-                        if (effect.category == other_effect.category and 
-                            effect.positive != other_effect.positive):
-                            conflicts.append(other_rule)
-                            break
+        query = ("SELECT " + self._RULE_SELECT + " FROM rules WHERE " + " AND ".join(clauses) +
+                 " ORDER BY confidence_score DESC, authority_level ASC")
         
-        return conflicts
+        with self._connect() as conn:
+            deserialize = self.deserialize_rule
+            return [deserialize(row) for row in self._execute_tuples(conn, query, params).fetchall()]
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get statistics about the knowledge base"""
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) as total_rules FROM rules")
-            total_rules = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(DISTINCT source_title) as unique_sources FROM rules")
-            unique_sources = cursor.fetchone()[0]
+        with self._connect() as conn:
+            # The scalar aggregates share one pass over the table
+            cursor = conn.execute("""
+                SELECT COUNT(*) as total_rules,
+                       COUNT(DISTINCT source_title) as unique_sources,
+                       AVG(confidence_score) as avg_confidence
+                FROM rules
+            """)
+            total_rules, unique_sources, avg_confidence = cursor.fetchone()
             
             cursor = conn.execute("SELECT planet, COUNT(*) as count FROM rules WHERE planet IS NOT NULL GROUP BY planet ORDER BY count DESC")
             planet_counts = dict(cursor.fetchall())
             
             cursor = conn.execute("SELECT house, COUNT(*) as count FROM rules WHERE house IS NOT NULL GROUP BY house ORDER BY house")
             house_counts = dict(cursor.fetchall())
-            
-            cursor = conn.execute("SELECT AVG(confidence_score) as avg_confidence FROM rules")
-            avg_confidence = cursor.fetchone()[0]
         
         return {
             'total_rules': total_rules,
@@ -444,8 +747,25 @@ class KnowledgeBase:
         # Ensure export directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn, \
+                open(output_path, 'w', encoding='utf-8') as f:
+            total_rules = conn.execute("SELECT COUNT(*) FROM rules").fetchone()[0]
+            
+            export_info = {
+                'exported_at': datetime.now().isoformat(),
+                'total_rules': total_rules,
+                'database_path': self.db_path,
+                'export_info': {
+                    'source': 'Astrology AI Knowledge Base',
+                    'table': 'rules',
+                    'version': '1.0.0'
+                }
+            }
+            
+            # Write the header, then each rule as it comes off the cursor,
+            # laid out as if the whole document were dumped with indent=2
+            header = dumps_json(export_info, indent=True)
+            f.write(header[:-2] + ',\n  "rules": [')
             
             # Query the correct table where data is actually stored
             cursor = conn.execute('''
@@ -457,24 +777,24 @@ class KnowledgeBase:
                 ORDER BY confidence_score DESC, authority_level ASC
             ''')
             
-            rules = []
+            written = 0
             for row in cursor:
                 rule_dict = dict(row)
                 
                 # Parse JSON fields
                 try:
                     if rule_dict['conditions_json']:
-                        rule_dict['conditions'] = json.loads(rule_dict['conditions_json'])
+                        rule_dict['conditions'] = loads_json(rule_dict['conditions_json'])
                     else:
                         rule_dict['conditions'] = {}
                     
                     if rule_dict['effects_json']:
-                        rule_dict['effects'] = json.loads(rule_dict['effects_json'])
+                        rule_dict['effects'] = loads_json(rule_dict['effects_json'])
                     else:
                         rule_dict['effects'] = []
                     
                     if rule_dict['tags_json']:
-                        rule_dict['tags'] = json.loads(rule_dict['tags_json'])
+                        rule_dict['tags'] = loads_json(rule_dict['tags_json'])
                     else:
                         rule_dict['tags'] = []
                     
@@ -489,22 +809,36 @@ class KnowledgeBase:
                     rule_dict['effects'] = []
                     rule_dict['tags'] = []
                 
-                rules.append(rule_dict)
-        
-        export_data = {
-            'exported_at': datetime.now().isoformat(),
-            'total_rules': len(rules),
-            'database_path': self.db_path,
-            'export_info': {
-                'source': 'Astrology AI Knowledge Base',
-                'table': 'rules',
-                'version': '1.0.0'
-            },
-            'rules': rules
-        }
+                if written:
+                    f.write(',')
+                f.write('\n    ' + dumps_json(rule_dict, indent=True).replace('\n', '\n    '))
+                written += 1
+            
+            f.write('\n  ]\n}' if written else ']\n}')
+        
+        return output_path
+    
+    def export_db_snapshot(self, output_path: str = None) -> str:
+        """
+        Copy the whole database to output_path with SQLite's backup API
+        
+        Pages are copied as they are, which is far faster than a JSON export;
+        use this for operational copies and export_rules_json for readable ones.
+        """
+        
+        if output_path is None:
+            try:
+                output_path = str(get_export_path("astrology_rules_snapshot.db"))
+            except:
+                output_path = "data/astrology_rules_snapshot.db"
+        
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        snapshot = sqlite3.connect(output_path)
+        try:
+            self._connect().backup(snapshot)
+        finally:
+            snapshot.close()
         
         return output_path
 
@@ -536,9 +870,9 @@ def demo_knowledge_base():
     print(f"✅ Stored {stored_count} rules")
     
     # Test searches
-    print(f"\n🔍 Mars rules: {len(kb.search_rules(planet='Mars'))}")
-    print(f"🔍 7th house rules: {len(kb.search_rules(house=7))}")
-    print(f"🔍 High confidence rules: {len(kb.search_rules(min_confidence=0.7))}")
+    print(f"\n🔍 Mars rules: {kb.count_search_rules(planet='Mars')}")
+    print(f"🔍 7th house rules: {kb.count_search_rules(house=7)}")
+    print(f"🔍 High confidence rules: {kb.count_search_rules(min_confidence=0.7)}")
     
     # Show stats
     stats = kb.get_database_stats()
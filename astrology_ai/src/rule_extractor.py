@@ -4,18 +4,46 @@ Enhanced rule extraction system specifically designed for classical astrology te
 Handles OCR issues, complex sentence structures, and improves accuracy
 """
 
+import dataclasses
+import hashlib
+import logging
 import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 from .data_models import (
     AstrologicalRule, AstrologicalCondition, AstrologicalEffect, 
     SourceInfo, AuthorityLevel
 )
+from .knowledge_base import KnowledgeBase, dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+# Most sentences an extractor remembers the extraction result for
+RULE_CACHE_SIZE = 100000
+
+# Bump when extraction code changes its output so stale on-disk cache entries
+# are ignored; changes to the pattern and keyword tables are picked up by the
+# cache version key on their own (see RuleExtractor._tables_version)
+RULE_CACHE_VERSION = 2
+
+
+def _literal_word(pattern: str) -> Optional[str]:
+    """Return pattern if it has no regex syntax (so it matches only itself), else None"""
+    if any(char in '.^$*+?{}[]\\|()' for char in pattern):
+        return None
+    return pattern
 
 
 class RuleExtractor:
     """Enhanced rule extractor designed for classical astrology texts with OCR issues"""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Args:
+            cache_path: SQLite file to persist the sentence cache in across runs (optional)
+        """
         # Enhanced planet names including Sanskrit variants
         self.planet_names = {
             'sun': ['sun', 'surya', 'ravi', 'arka', 'aditya', 'soorya'],
@@ -102,7 +130,10 @@ class RuleExtractor:
             'lordship': [
                 r'(?:lord|ruler|swami|adhipati)\s+of\s+(?:the)?\s*(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?',
                 r'(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s+(?:lord|ruler|swami|adhipati)',
-                r'([^,.]+)\s+being\s+(?:the)?\s+lord\s+of\s+([^,.]+)'
+                # Starts only where a clause does: a match starting inside the
+                # clause ends in the same place, and trying [^,.]+ from every
+                # position in it is quadratic in the clause length
+                r'(?:^|(?<=[,.]))([^,.]+)\s+being\s+(?:the)?\s+lord\s+of\s+([^,.]+)'
             ],
             'dignity': [
                 r'(?:exalted|uccha|in\s+exaltation)\s+(?:in)?\s*([^,.]+)?',
@@ -266,6 +297,211 @@ class RuleExtractor:
             'ythe': 'y the',
             'zthe': 'z the'
         }
+        
+        # Words marking an extracted effect description as positive or negative
+        self.positive_effect_words = (
+            'wealth', 'prosperity', 'success', 'happiness', 'fortune', 'good',
+            'beneficial', 'excellent', 'favorable', 'auspicious'
+        )
+        self.negative_effect_words = (
+            'problems', 'difficulties', 'trouble', 'disease', 'death', 'enemy',
+            'conflict', 'loss', 'bad', 'harmful', 'unfavorable'
+        )
+        
+        # Effect categories, checked in order against effect descriptions
+        self.effect_categories = {
+            'wealth': ['wealth', 'money', 'riches', 'prosperity', 'financial', 'earnings', 'income', 'fortune'],
+            'health': ['health', 'disease', 'illness', 'medical', 'body', 'physical', 'ailment', 'cure'],
+            'marriage': ['marriage', 'spouse', 'partner', 'relationship', 'wife', 'husband', 'matrimony'],
+            'career': ['career', 'job', 'profession', 'work', 'business', 'employment', 'occupation', 'service'],
+            'education': ['education', 'learning', 'knowledge', 'study', 'wisdom', 'intelligence', 'scholarship'],
+            'spiritual': ['spiritual', 'religious', 'devotion', 'meditation', 'divine', 'sacred', 'temple'],
+            'family': ['family', 'children', 'parents', 'siblings', 'brother', 'sister', 'father', 'mother'],
+            'travel': ['travel', 'journey', 'foreign', 'abroad', 'distant', 'pilgrimage'],
+            'government': ['government', 'king', 'ruler', 'authority', 'power', 'official', 'administrative'],
+            'enemies': ['enemy', 'enemies', 'opponent', 'rival', 'adversary', 'competition'],
+            'property': ['property', 'land', 'house', 'real estate', 'inheritance', 'patrimony']
+        }
+        
+        # Enhanced categorization keywords, for sentences without an explicit effect
+        self.sentence_categories = {
+            'wealth': ['wealth', 'money', 'riches', 'prosperity', 'financial', 'dhan', 'sampatti'],
+            'health': ['health', 'disease', 'illness', 'body', 'medical', 'roga', 'arogya'],
+            'marriage': ['marriage', 'spouse', 'partner', 'wife', 'husband', 'vivah', 'patni'],
+            'career': ['career', 'job', 'profession', 'work', 'business', 'karma', 'vyavasaya'],
+            'education': ['education', 'learning', 'knowledge', 'study', 'vidya', 'gyan'],
+            'family': ['children', 'parents', 'siblings', 'family', 'putra', 'mata', 'pita'],
+            'spiritual': ['spiritual', 'religious', 'devotion', 'dharma', 'moksha', 'tapas'],
+            'government': ['king', 'ruler', 'authority', 'government', 'raja', 'adhikari'],
+            'travel': ['travel', 'journey', 'foreign', 'pravasa', 'yatra'],
+            'enemies': ['enemy', 'enemies', 'opponent', 'satru', 'ari'],
+            'property': ['property', 'land', 'house', 'bhumi', 'griha'],
+            'fortune': ['fortune', 'luck', 'destiny', 'bhagya', 'daiva']
+        }
+        
+        # Extraction result (rule or None) per sentence; classical aphorisms
+        # recur across books, so later books mostly hit this
+        self._rule_cache: Dict[str, Optional[AstrologicalRule]] = {}
+        
+        # On-disk copy of the cache, loaded on first cached extraction; only
+        # entries written by an extractor with the same tables are reused
+        self.cache_path = cache_path
+        self._disk_cache_loaded = False
+        self._unsaved_rules: Dict[str, Optional[AstrologicalRule]] = {}
+        self._cache_version = self._tables_version()
+        
+        # Cleaned text and (planet, house, sign, ascendant) found in it last
+        self._last_components: Optional[Tuple[str, Tuple]] = None
+        
+        self._compile_patterns()
+    
+    def _compile_patterns(self):
+        """Compile every regex applied per sentence once, from the name and pattern tables above"""
+        planet_alternation = "|".join(["|".join(variants) for variants in self.planet_names.values()])
+        sign_alternation = "|".join(["|".join(variants) for variants in self.sign_names.values()])
+        effect_verbs = r'(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
+        
+        # Words a sentence must contain for rule patterns 1-5 (an effect verb)
+        # and pattern 6 (a yoga or combination) to match at all
+        self._effect_verb_stems = ('give', 'cause', 'bring', 'produce', 'result', 'lead')
+        self._yoga_words = ('yoga', 'combination', 'configuration')
+        
+        # clean_ocr_text word splits, in the order they are applied, each with
+        # the literal word it needs (None for the aspect and condition regexes)
+        self._camel_case_re = re.compile(r'([a-z])([A-Z])')
+        self._ocr_split_patterns = []
+        for names in (self.planet_names, self.sign_names):
+            for variants in names.values():
+                for variant in variants:
+                    self._ocr_split_patterns.append(
+                        (_literal_word(variant), re.compile(f'({variant})(?=[a-z])', re.IGNORECASE))
+                    )
+        
+        split_words = []
+        for keywords in list(self.effect_patterns.values()) + list(self.strength_indicators.values()):
+            split_words.extend(keywords)
+        split_words.extend(self.aspect_patterns)
+        for condition_type in self.condition_patterns.values():
+            split_words.extend(condition_type)
+        for word in split_words:
+            self._ocr_split_patterns.append(
+                (_literal_word(word), re.compile(f'({word})(?=[A-Z][a-z]|[0-9])', re.IGNORECASE))
+            )
+        
+        # Every house indicator captures a number, so text without a digit
+        # needs none of them run
+        self._house_patterns_ci = [re.compile(pattern, re.IGNORECASE) for pattern in self.house_indicators]
+        self._digit_re = re.compile(r'\d')
+        self._whitespace_re = re.compile(r'\s+')
+        
+        # Display names, and the first planet/sign each variant belongs to
+        self._planet_titles = {planet_key: planet_key.title() for planet_key in self.planet_names}
+        self._sign_titles = {sign_key: sign_key.title() for sign_key in self.sign_names}
+        self._planet_by_variant = {}
+        for planet_key, variants in self.planet_names.items():
+            for variant in variants:
+                self._planet_by_variant.setdefault(variant, self._planet_titles[planet_key])
+        self._sign_by_variant = {}
+        for sign_key, variants in self.sign_names.items():
+            for variant in variants:
+                self._sign_by_variant.setdefault(variant, self._sign_titles[sign_key])
+        
+        # Component extraction. Planet and sign variants are single words, so
+        # a whole-word match is membership in the text's set of words
+        self._word_re = re.compile(r'\w+')
+        self._house_patterns = [re.compile(pattern) for pattern in self.house_indicators]
+        self._lagna_re = re.compile(r'\b(?:lagna|ascendant)\b')
+        self._sign_patterns = [
+            (sign_key, re.compile(rf'\b{variant}\b', re.IGNORECASE))
+            for sign_key, variants in self.sign_names.items() for variant in variants
+        ]
+        self._sign_phrase_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'in\s+(?:the\s+)?sign\s+of\s+([A-Za-z]+)',
+                r'placed\s+in\s+([A-Za-z]+)',
+                r'posited\s+in\s+([A-Za-z]+)',
+                r'occupies\s+([A-Za-z]+)'
+            )
+        ]
+        self._ascendant_patterns = [re.compile(pattern) for pattern in self.ascendant_patterns]
+        self._effect_indicator_patterns = [
+            (_literal_word(indicator), re.compile(rf'\b{indicator}\b\s*([^.!?]*?)(?:[.!?]|$)'), strength)
+            for strength, indicators in self.effect_patterns.items() for indicator in indicators
+        ]
+        # One scan over the text for the indicators it contains. Where several
+        # start at the same position only the longest is reported, and the
+        # others are its prefixes
+        literal_indicators = sorted(
+            {indicator for indicator, _, _ in self._effect_indicator_patterns if indicator},
+            key=len, reverse=True
+        )
+        self._effect_indicator_scan_re = re.compile(
+            r'(?=\b(' + '|'.join(map(re.escape, literal_indicators)) + r')\b)'
+        )
+        
+        # Rule patterns 1-6
+        self._placement_rule_re = re.compile(
+            rf'({planet_alternation})\s+(?:in\s+(?:the\s+)?)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s*)?(?:in\s+)?({sign_alternation})?.*?{effect_verbs}',
+            re.IGNORECASE
+        )
+        self._ascendant_rule_re = re.compile(
+            rf'(?:for\s+)?({sign_alternation})\s*(?:ascendant|lagna|rising).*?({planet_alternation})\s+(?:in\s+(?:the\s+)?)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s*)?(?:in\s+)?({sign_alternation})?.*?{effect_verbs}',
+            re.IGNORECASE
+        )
+        self._aspect_rule_re = re.compile(
+            rf'({planet_alternation})\s+(?:aspects?|conjuncts?|conjoins?|in\s+conjunction\s+with)\s+({planet_alternation}).*?{effect_verbs}',
+            re.IGNORECASE
+        )
+        self._lordship_rule_re = re.compile(
+            rf'(?:lord|ruler)\s+of\s+(?:the\s+)?(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s+(?:in|placed\s+in|posited\s+in)\s+(?:the\s+)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?|({sign_alternation})).*?{effect_verbs}',
+            re.IGNORECASE
+        )
+        
+        # Extended nakshatra list
+        nakshatras = [
+            'ashwini', 'bharani', 'krittika', 'rohini', 'mrigashira', 'ardra',
+            'punarvasu', 'pushya', 'ashlesha', 'magha', 'purva phalguni', 'uttara phalguni',
+            'hasta', 'chitra', 'swati', 'vishakha', 'anuradha', 'jyeshtha',
+            'mula', 'purva ashadha', 'uttara ashadha', 'shravana', 'dhanishta',
+            'shatabhisha', 'purva bhadrapada', 'uttara bhadrapada', 'revati'
+        ]
+        self._nakshatra_rule_re = re.compile(
+            rf'({planet_alternation})\s+(?:in|placed\s+in)\s+({"|".join(nakshatras)})\s*(?:nakshatra)?.*?{effect_verbs}',
+            re.IGNORECASE
+        )
+        
+        # Common yoga patterns
+        self._yoga_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'(raj\s*yoga|dhana\s*yoga|yoga\s+of.*?|.*?\s+yoga)\s+(?:is\s+formed|forms|gives|causes|brings)\s+([^.!?]*)',
+                r'(?:when|if)\s+([^.!?]*?)\s+(?:forms?|creates?|makes?)\s+(?:a\s+)?yoga.*?(?:gives?|causes?|brings?)\s+([^.!?]*)',
+                r'(?:combination|configuration)\s+of\s+([^.!?]*?)\s+(?:gives?|causes?|brings?|produces?)\s+([^.!?]*)'
+            )
+        ]
+        
+        # Confidence scoring and relaxed-extraction effects
+        self._merged_word_re = re.compile(r'[a-z]{15,}')
+        self._long_merged_word_re = re.compile(r'[a-z]{20,}')
+        # Only whether a structure occurs matters, so the patterns carry no
+        # leading '.*?' or trailing '.*' (a leading '.*?' makes a failed
+        # search quadratic in the sentence length)
+        self._structure_patterns = [
+            re.compile(pattern) for pattern in (
+                r'if\s+.*?\s+then\s+',  # Conditional structure
+                r'when\s+.*?\s+',       # Temporal structure
+                r'\s+gives?\s+',        # Causal structure
+                r'\s+causes?\s+',       # Causal structure
+                r'\s+results?\s+in\s+'  # Result structure
+            )
+        ]
+        self._general_effect_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)',
+                r'(?:will\s+have|will\s+get|will\s+be|will\s+become)\s+([^.!?]*)',
+                r'(?:makes?|renders?|creates?)\s+([^.!?]*)',
+                r'(?:indicates?|signifies?|shows?)\s+([^.!?]*)'
+            )
+        ]
     
     def clean_ocr_text(self, text):
         # Basic OCR fixes
@@ -273,156 +509,133 @@ class RuleExtractor:
             text = text.replace(ocr_error, correction)
 
         # Fix camelCase words
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-
-        # Handle planet names
-        for planet_group in self.planet_names.values():
-            for planet in planet_group:
-                # Fix planet references
-                pattern = f'({planet})(?=[a-z])'
-                text = re.sub(pattern, r'\1 ', text, flags=re.IGNORECASE)
+        text = self._camel_case_re.sub(r'\1 \2', text)
 
-        # Handle sign names
-        for sign_group in self.sign_names.values():
-            for sign in sign_group:
-                # Fix sign references
-                pattern = f'({sign})(?=[a-z])'
-                text = re.sub(pattern, r'\1 ', text, flags=re.IGNORECASE)
-
-        # Fix effect patterns
-        for effect_type in self.effect_patterns.values():
-            for effect in effect_type:
-                pattern = f'({effect})(?=[A-Z][a-z]|[0-9])'
-                text = re.sub(pattern, r'\1 ', text, flags=re.IGNORECASE)
-
-        # Fix strength indicators
-        for strength_type in self.strength_indicators.values():
-            for indicator in strength_type:
-                pattern = f'({indicator})(?=[A-Z][a-z]|[0-9])'
-                text = re.sub(pattern, r'\1 ', text, flags=re.IGNORECASE)
-
-        # Fix aspect patterns
-        for aspect_pattern in self.aspect_patterns:
-            text = re.sub(f'({aspect_pattern})(?=[A-Z][a-z]|[0-9])', r'\1 ', text, flags=re.IGNORECASE)
-
-        # Fix condition patterns
-        for condition_type in self.condition_patterns.values():
-            for pattern in condition_type:
-                text = re.sub(f'({pattern})(?=[A-Z][a-z]|[0-9])', r'\1 ', text, flags=re.IGNORECASE)
+        # Split planet and sign names, effect and strength words, aspect and
+        # condition phrases off the word they run into. One lowercased copy
+        # tells which words occur at all; only ASCII text is checked this way,
+        # since IGNORECASE also matches a few non-ASCII letters (e.g. 'ſ')
+        text_lower = text.lower() if text.isascii() else None
+        for word, pattern in self._ocr_split_patterns:
+            if word is not None and text_lower is not None and word not in text_lower:
+                continue
+            text, count = pattern.subn(r'\1 ', text)
+            if count and text_lower is not None:
+                text_lower = text.lower()
 
         # Fix house references
-        for house_pattern in self.house_indicators:
-            text = re.sub(house_pattern, r' \1 house ', text, flags=re.IGNORECASE)
+        if self._digit_re.search(text):
+            for house_pattern in self._house_patterns_ci:
+                text = house_pattern.sub(r' \1 house ', text)
 
         # Remove extra spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = self._whitespace_re.sub(' ', text)
         text = text.strip()
 
         return text
     
-    def extract_planet_advanced(self, text: str) -> Optional[str]:
+    def extract_planet_advanced(self, text: str, text_clean: Optional[str] = None) -> Optional[str]:
         """Advanced planet extraction with variants"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
+        
+        words = set(self._word_re.findall(text_clean))
         
         for planet_key, variants in self.planet_names.items():
-            for variant in variants:
-                if re.search(rf'\b{variant}\b', text_clean):
-                    return planet_key.title()
+            if any(variant in words for variant in variants):
+                return self._planet_titles[planet_key]
         
         return None
     
-    def extract_house_advanced(self, text: str) -> Optional[int]:
+    def extract_house_advanced(self, text: str, text_clean: Optional[str] = None) -> Optional[int]:
         """Advanced house extraction"""
-        text_clean = self.clean_ocr_text(text)
-        
-        # Check for explicit house numbers
-        for pattern in self.house_indicators:
-            matches = re.findall(pattern, text_clean)
-            if matches:
-                try:
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
+        
+        # Check for explicit house numbers (each pattern captures one \d+
+        # group, so the first match always converts to int)
+        if self._digit_re.search(text_clean):
+            for pattern in self._house_patterns:
+                matches = pattern.findall(text_clean)
+                if matches:
                     house_num = int(matches[0])
                     if 1 <= house_num <= 12:
                         return house_num
-                except (ValueError, IndexError):
-                    continue
         
         # Check for lagna/ascendant (1st house)
-        if re.search(r'\b(?:lagna|ascendant)\b', text_clean):
+        if self._lagna_re.search(text_clean):
             return 1
         
         return None
     
-    def extract_sign(self, text: str) -> Optional[str]:
+    def extract_sign(self, text: str, text_clean: Optional[str] = None) -> Optional[str]:
         """Extract zodiac sign from text"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        # Check for each sign and its variants
-        for sign_key, variants in self.sign_names.items():
-            for variant in variants:
-                pattern = rf'\b{variant}\b'
-                if re.search(pattern, text_clean, re.IGNORECASE):
-                    return sign_key.title()
+        # Check for each sign and its variants (case-insensitively; outside
+        # ASCII, IGNORECASE matching is not the same as comparing lowercase)
+        if text_clean.isascii():
+            words = set(self._word_re.findall(text_clean.lower()))
+            
+            for sign_key, variants in self.sign_names.items():
+                if any(variant in words for variant in variants):
+                    return self._sign_titles[sign_key]
+        else:
+            for sign_key, pattern in self._sign_patterns:
+                if pattern.search(text_clean):
+                    return self._sign_titles[sign_key]
         
         # Check for special patterns
-        sign_patterns = [
-            r'in\s+(?:the\s+)?sign\s+of\s+([A-Za-z]+)',
-            r'placed\s+in\s+([A-Za-z]+)',
-            r'posited\s+in\s+([A-Za-z]+)',
-            r'occupies\s+([A-Za-z]+)'
-        ]
-        
-        for pattern in sign_patterns:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+        for pattern in self._sign_phrase_patterns:
+            match = pattern.search(text_clean)
             if match:
-                sign_text = match.group(1).lower()
-                for sign_key, variants in self.sign_names.items():
-                    if sign_text in variants:
-                        return sign_key.title()
+                sign = self._sign_by_variant.get(match.group(1).lower())
+                if sign:
+                    return sign
         
         return None
     
-    def extract_ascendant_context(self, text: str) -> Optional[str]:
+    def extract_ascendant_context(self, text: str, text_clean: Optional[str] = None) -> Optional[str]:
         """Extract ascendant context from sentence"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        for pattern in self.ascendant_patterns:
-            match = re.search(pattern, text_clean)
+        for pattern in self._ascendant_patterns:
+            match = pattern.search(text_clean)
             if match:
-                sign = match.group(1)
                 # Normalize sign name
-                for sign_key, variants in self.sign_names.items():
-                    if sign in variants:
-                        return sign_key.title()
+                sign = self._sign_by_variant.get(match.group(1))
+                if sign:
+                    return sign
         
         return None
     
-    def extract_effects_advanced(self, text: str) -> List[AstrologicalEffect]:
+    def extract_effects_advanced(self, text: str, text_clean: Optional[str] = None) -> List[AstrologicalEffect]:
         """Enhanced effect extraction"""
         effects = []
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
         # Find all effect patterns
-        all_indicators = []
-        for strength, indicators in self.effect_patterns.items():
-            all_indicators.extend([(ind, strength) for ind in indicators])
+        found = [match.group(1) for match in self._effect_indicator_scan_re.finditer(text_clean)]
         
-        for indicator, strength in all_indicators:
-            pattern = rf'\b{indicator}\b\s*([^.!?]*?)(?:[.!?]|$)'
-            matches = re.findall(pattern, text_clean)
+        for indicator, pattern, strength in self._effect_indicator_patterns:
+            if indicator is not None and not any(word.startswith(indicator) for word in found):
+                continue
+            
+            matches = pattern.findall(text_clean)
             
             for match in matches:
                 effect_text = match.strip()
                 if len(effect_text) > 5:  # Minimum meaningful length
                     
-                    # Determine if positive or negative
-                    positive_words = ['wealth', 'prosperity', 'success', 'happiness', 'fortune', 'good', 'beneficial', 'excellent', 'favorable', 'auspicious']
-                    negative_words = ['problems', 'difficulties', 'trouble', 'disease', 'death', 'enemy', 'conflict', 'loss', 'bad', 'harmful', 'unfavorable']
-                    
-                    is_positive = any(word in effect_text for word in positive_words)
-                    is_negative = any(word in effect_text for word in negative_words)
-                    
-                    # Default to positive if unclear
-                    positive = is_positive or not is_negative
+                    # Determine if positive or negative, defaulting to positive
+                    # if unclear (a positive word settles it)
+                    positive = (
+                        any(word in effect_text for word in self.positive_effect_words)
+                        or not any(word in effect_text for word in self.negative_effect_words)
+                    )
                     
                     effect = AstrologicalEffect(
                         category=self.categorize_effect_advanced(effect_text),
@@ -434,19 +647,18 @@ class RuleExtractor:
         
         return effects if effects else [self.create_default_effect()]
     
-    def extract_house_number(self, text: str) -> Optional[int]:
+    def extract_house_number(self, text: str, text_clean: Optional[str] = None) -> Optional[int]:
         """Extract house number from text"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        for pattern in self.house_indicators:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
-            if match:
-                try:
+        if self._digit_re.search(text_clean):
+            for pattern in self._house_patterns_ci:
+                match = pattern.search(text_clean)
+                if match:
                     house_num = int(match.group(1))
                     if 1 <= house_num <= 12:  # Valid house numbers are 1-12
                         return house_num
-                except (ValueError, IndexError):
-                    continue
         
         # Try to find direct number references
         number_words = {
@@ -461,48 +673,46 @@ class RuleExtractor:
         
         return None
     
-    def extract_ascendant_context(self, text: str) -> Optional[str]:
+    def extract_ascendant_context(self, text: str, text_clean: Optional[str] = None) -> Optional[str]:
         """Extract ascendant context from sentence"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        for pattern in self.ascendant_patterns:
-            match = re.search(pattern, text_clean)
+        for pattern in self._ascendant_patterns:
+            match = pattern.search(text_clean)
             if match:
-                sign = match.group(1)
                 # Normalize sign name
-                for sign_key, variants in self.sign_names.items():
-                    if sign in variants:
-                        return sign_key.title()
+                sign = self._sign_by_variant.get(match.group(1))
+                if sign:
+                    return sign
         
         return None
     
-    def extract_effects_advanced(self, text: str) -> List[AstrologicalEffect]:
+    def extract_effects_advanced(self, text: str, text_clean: Optional[str] = None) -> List[AstrologicalEffect]:
         """Enhanced effect extraction"""
         effects = []
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
         # Find all effect patterns
-        all_indicators = []
-        for strength, indicators in self.effect_patterns.items():
-            all_indicators.extend([(ind, strength) for ind in indicators])
+        found = [match.group(1) for match in self._effect_indicator_scan_re.finditer(text_clean)]
         
-        for indicator, strength in all_indicators:
-            pattern = rf'\b{indicator}\b\s*([^.!?]*?)(?:[.!?]|$)'
-            matches = re.findall(pattern, text_clean)
+        for indicator, pattern, strength in self._effect_indicator_patterns:
+            if indicator is not None and not any(word.startswith(indicator) for word in found):
+                continue
+            
+            matches = pattern.findall(text_clean)
             
             for match in matches:
                 effect_text = match.strip()
                 if len(effect_text) > 5:  # Minimum meaningful length
                     
-                    # Determine if positive or negative
-                    positive_words = ['wealth', 'prosperity', 'success', 'happiness', 'fortune', 'good', 'beneficial', 'excellent', 'favorable', 'auspicious']
-                    negative_words = ['problems', 'difficulties', 'trouble', 'disease', 'death', 'enemy', 'conflict', 'loss', 'bad', 'harmful', 'unfavorable']
-                    
-                    is_positive = any(word in effect_text for word in positive_words)
-                    is_negative = any(word in effect_text for word in negative_words)
-                    
-                    # Default to positive if unclear
-                    positive = is_positive or not is_negative
+                    # Determine if positive or negative, defaulting to positive
+                    # if unclear (a positive word settles it)
+                    positive = (
+                        any(word in effect_text for word in self.positive_effect_words)
+                        or not any(word in effect_text for word in self.negative_effect_words)
+                    )
                     
                     effect = AstrologicalEffect(
                         category=self.categorize_effect_advanced(effect_text),
@@ -514,25 +724,12 @@ class RuleExtractor:
         
         return effects if effects else [self.create_default_effect()]
     
-    def categorize_effect_advanced(self, effect_text: str) -> str:
-        """Enhanced effect categorization"""
-        categories = {
-            'wealth': ['wealth', 'money', 'riches', 'prosperity', 'financial', 'earnings', 'income', 'fortune'],
-            'health': ['health', 'disease', 'illness', 'medical', 'body', 'physical', 'ailment', 'cure'],
-            'marriage': ['marriage', 'spouse', 'partner', 'relationship', 'wife', 'husband', 'matrimony'],
-            'career': ['career', 'job', 'profession', 'work', 'business', 'employment', 'occupation', 'service'],
-            'education': ['education', 'learning', 'knowledge', 'study', 'wisdom', 'intelligence', 'scholarship'],
-            'spiritual': ['spiritual', 'religious', 'devotion', 'meditation', 'divine', 'sacred', 'temple'],
-            'family': ['family', 'children', 'parents', 'siblings', 'brother', 'sister', 'father', 'mother'],
-            'travel': ['travel', 'journey', 'foreign', 'abroad', 'distant', 'pilgrimage'],
-            'government': ['government', 'king', 'ruler', 'authority', 'power', 'official', 'administrative'],
-            'enemies': ['enemy', 'enemies', 'opponent', 'rival', 'adversary', 'competition'],
-            'property': ['property', 'land', 'house', 'real estate', 'inheritance', 'patrimony']
-        }
+    def categorize_effect_advanced(self, effect_text: str, effect_lower: Optional[str] = None) -> str:
+        """Enhanced effect categorization; pass effect_lower if the lowercased text is at hand"""
+        if effect_lower is None:
+            effect_lower = effect_text.lower()
         
-        effect_lower = effect_text.lower()
-        
-        for category, keywords in categories.items():
+        for category, keywords in self.effect_categories.items():
             if any(keyword in effect_lower for keyword in keywords):
                 return category
         
@@ -580,25 +777,25 @@ class RuleExtractor:
             confidence -= 0.1
         
         # Penalty for too many OCR-like artifacts
-        ocr_artifacts = len(re.findall(r'[a-z]{15,}', sentence))  # Very long merged words
+        ocr_artifacts = len(self._merged_word_re.findall(sentence))  # Very long merged words
         if ocr_artifacts > 2:
             confidence -= 0.2
         
         # Bonus for classical astrology terms
         classical_terms = ['yoga', 'dosha', 'dasa', 'bhava', 'graha', 'rasi']
-        if any(term in sentence.lower() for term in classical_terms):
+        sentence_lower = sentence.lower()
+        if any(term in sentence_lower for term in classical_terms):
             confidence += 0.1
         
         return min(1.0, max(0.1, confidence))
     
-    def extract_rule_pattern_1(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_1(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'Planet in House/Sign gives/causes Effect'"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
         # Enhanced pattern matching
-        pattern = rf'({"|".join(["|".join(variants) for variants in self.planet_names.values()])})\s+(?:in\s+(?:the\s+)?)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s*)?(?:in\s+)?({"|".join(["|".join(variants) for variants in self.sign_names.values()])})?.*?(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
-        
-        match = re.search(pattern, text_clean, re.IGNORECASE)
+        match = self._placement_rule_re.search(text_clean)
         if match:
             planet_raw = match.group(1)
             house_raw = match.group(2)
@@ -606,11 +803,7 @@ class RuleExtractor:
             effect_raw = match.group(4)
             
             # Normalize planet
-            planet = None
-            for planet_key, variants in self.planet_names.items():
-                if planet_raw.lower() in variants:
-                    planet = planet_key.title()
-                    break
+            planet = self._planet_by_variant.get(planet_raw.lower())
             
             # Parse house
             house = None
@@ -625,10 +818,7 @@ class RuleExtractor:
             # Normalize sign
             sign = None
             if sign_raw:
-                for sign_key, variants in self.sign_names.items():
-                    if sign_raw.lower() in variants:
-                        sign = sign_key.title()
-                        break
+                sign = self._sign_by_variant.get(sign_raw.lower())
             
             return {
                 'planet': planet,
@@ -640,13 +830,12 @@ class RuleExtractor:
         
         return None
     
-    def extract_rule_pattern_2(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_2(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'For [Sign] ascendant, Planet in House/Sign Effect'"""
-        text_clean = self.clean_ocr_text(text)
-        
-        pattern = rf'(?:for\s+)?({"|".join(["|".join(variants) for variants in self.sign_names.values()])})\s*(?:ascendant|lagna|rising).*?({"|".join(["|".join(variants) for variants in self.planet_names.values()])})\s+(?:in\s+(?:the\s+)?)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s*)?(?:in\s+)?({"|".join(["|".join(variants) for variants in self.sign_names.values()])})?.*?(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        match = re.search(pattern, text_clean, re.IGNORECASE)
+        match = self._ascendant_rule_re.search(text_clean)
         if match:
             ascendant_raw = match.group(1)
             planet_raw = match.group(2)
@@ -655,11 +844,7 @@ class RuleExtractor:
             effect_raw = match.group(5)
             
             # Process similar to pattern 1
-            planet = None
-            for planet_key, variants in self.planet_names.items():
-                if planet_raw.lower() in variants:
-                    planet = planet_key.title()
-                    break
+            planet = self._planet_by_variant.get(planet_raw.lower())
             
             house = None
             if house_raw:
@@ -672,16 +857,9 @@ class RuleExtractor:
             
             sign = None
             if sign_raw:
-                for sign_key, variants in self.sign_names.items():
-                    if sign_raw.lower() in variants:
-                        sign = sign_key.title()
-                        break
+                sign = self._sign_by_variant.get(sign_raw.lower())
             
-            ascendant = None
-            for sign_key, variants in self.sign_names.items():
-                if ascendant_raw.lower() in variants:
-                    ascendant = sign_key.title()
-                    break
+            ascendant = self._sign_by_variant.get(ascendant_raw.lower())
             
             return {
                 'planet': planet,
@@ -694,31 +872,22 @@ class RuleExtractor:
         
         return None
     
-    def extract_rule_pattern_3(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_3(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'Planet aspects/conjuncts Planet Effect'"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
         # Pattern for aspects and conjunctions
-        pattern = rf'({"|".join(["|".join(variants) for variants in self.planet_names.values()])})\s+(?:aspects?|conjuncts?|conjoins?|in\s+conjunction\s+with)\s+({"|".join(["|".join(variants) for variants in self.planet_names.values()])}).*?(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
-        
-        match = re.search(pattern, text_clean, re.IGNORECASE)
+        match = self._aspect_rule_re.search(text_clean)
         if match:
             planet1_raw = match.group(1)
             planet2_raw = match.group(2)
             effect_raw = match.group(3)
             
             # Normalize planets
-            planet1 = None
-            for planet_key, variants in self.planet_names.items():
-                if planet1_raw.lower() in variants:
-                    planet1 = planet_key.title()
-                    break
+            planet1 = self._planet_by_variant.get(planet1_raw.lower())
             
-            planet2 = None
-            for planet_key, variants in self.planet_names.items():
-                if planet2_raw.lower() in variants:
-                    planet2 = planet_key.title()
-                    break
+            planet2 = self._planet_by_variant.get(planet2_raw.lower())
             
             if planet1 and planet2:
                 return {
@@ -730,14 +899,13 @@ class RuleExtractor:
         
         return None
     
-    def extract_rule_pattern_4(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_4(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'Lord of House in House/Sign Effect'"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
         # Pattern for house lordship
-        pattern = rf'(?:lord|ruler)\s+of\s+(?:the\s+)?(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?\s+(?:in|placed\s+in|posited\s+in)\s+(?:the\s+)?(?:(\d+)(?:st|nd|rd|th)?\s*(?:house|bhava)?|({"|".join(["|".join(variants) for variants in self.sign_names.values()])})).*?(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
-        
-        match = re.search(pattern, text_clean, re.IGNORECASE)
+        match = self._lordship_rule_re.search(text_clean)
         if match:
             lord_house_raw = match.group(1)
             placed_house_raw = match.group(2)
@@ -763,10 +931,7 @@ class RuleExtractor:
             # Parse sign
             placed_sign = None
             if placed_sign_raw:
-                for sign_key, variants in self.sign_names.items():
-                    if placed_sign_raw.lower() in variants:
-                        placed_sign = sign_key.title()
-                        break
+                placed_sign = self._sign_by_variant.get(placed_sign_raw.lower())
             
             if lord_house and (placed_house or placed_sign):
                 return {
@@ -779,33 +944,19 @@ class RuleExtractor:
         
         return None
     
-    def extract_rule_pattern_5(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_5(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'Planet in Nakshatra Effect'"""
-        text_clean = self.clean_ocr_text(text)
-        
-        # Extended nakshatra list
-        nakshatras = [
-            'ashwini', 'bharani', 'krittika', 'rohini', 'mrigashira', 'ardra',
-            'punarvasu', 'pushya', 'ashlesha', 'magha', 'purva phalguni', 'uttara phalguni',
-            'hasta', 'chitra', 'swati', 'vishakha', 'anuradha', 'jyeshtha',
-            'mula', 'purva ashadha', 'uttara ashadha', 'shravana', 'dhanishta',
-            'shatabhisha', 'purva bhadrapada', 'uttara bhadrapada', 'revati'
-        ]
-        
-        pattern = rf'({"|".join(["|".join(variants) for variants in self.planet_names.values()])})\s+(?:in|placed\s+in)\s+({"|".join(nakshatras)})\s*(?:nakshatra)?.*?(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)'
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        match = re.search(pattern, text_clean, re.IGNORECASE)
+        match = self._nakshatra_rule_re.search(text_clean)
         if match:
             planet_raw = match.group(1)
             nakshatra_raw = match.group(2)
             effect_raw = match.group(3)
             
             # Normalize planet
-            planet = None
-            for planet_key, variants in self.planet_names.items():
-                if planet_raw.lower() in variants:
-                    planet = planet_key.title()
-                    break
+            planet = self._planet_by_variant.get(planet_raw.lower())
             
             if planet and nakshatra_raw:
                 return {
@@ -817,19 +968,13 @@ class RuleExtractor:
         
         return None
     
-    def extract_rule_pattern_6(self, text: str) -> Optional[Dict]:
+    def extract_rule_pattern_6(self, text: str, text_clean: Optional[str] = None) -> Optional[Dict]:
         """Pattern: 'Yoga combinations and special configurations'"""
-        text_clean = self.clean_ocr_text(text)
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(text)
         
-        # Common yoga patterns
-        yoga_patterns = [
-            r'(raj\s*yoga|dhana\s*yoga|yoga\s+of.*?|.*?\s+yoga)\s+(?:is\s+formed|forms|gives|causes|brings)\s+([^.!?]*)',
-            r'(?:when|if)\s+([^.!?]*?)\s+(?:forms?|creates?|makes?)\s+(?:a\s+)?yoga.*?(?:gives?|causes?|brings?)\s+([^.!?]*)',
-            r'(?:combination|configuration)\s+of\s+([^.!?]*?)\s+(?:gives?|causes?|brings?|produces?)\s+([^.!?]*)'
-        ]
-        
-        for pattern in yoga_patterns:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+        for pattern in self._yoga_patterns:
+            match = pattern.search(text_clean)
             if match:
                 yoga_desc = match.group(1)
                 effect_raw = match.group(2)
@@ -842,44 +987,53 @@ class RuleExtractor:
         
         return None
 
-    def extract_rule_from_sentence_improved(self, sentence: str, source_info: SourceInfo) -> Optional[AstrologicalRule]:
+    def extract_rule_from_sentence_improved(self, sentence: str, source_info: SourceInfo,
+                                            text_clean: Optional[str] = None) -> Optional[AstrologicalRule]:
         """Main improved rule extraction method with all patterns"""
         
+        # Every pattern works on the same OCR-cleaned sentence
+        if text_clean is None:
+            text_clean = self.clean_ocr_text(sentence)
+        
+        # Skip the pattern regexes whose required words are missing; like
+        # clean_ocr_text, only ASCII text is checked case-insensitively this way
+        text_lower = text_clean.lower() if text_clean.isascii() else None
+        try_effect_patterns = text_lower is None or any(stem in text_lower for stem in self._effect_verb_stems)
+        try_yoga_patterns = text_lower is None or any(word in text_lower for word in self._yoga_words)
+        
         # Try different patterns in order of specificity
         rule_data = None
         
         # Pattern 1: Basic placement (Planet in House/Sign gives Effect)
-        rule_data = self.extract_rule_pattern_1(sentence)
+        if try_effect_patterns:
+            rule_data = self.extract_rule_pattern_1(sentence, text_clean)
         
         # Pattern 2: Ascendant specific (For Sign ascendant, Planet in House/Sign Effect)
-        if not rule_data:
-            rule_data = self.extract_rule_pattern_2(sentence)
+        if not rule_data and try_effect_patterns:
+            rule_data = self.extract_rule_pattern_2(sentence, text_clean)
         
         # Pattern 3: Aspects and conjunctions
-        if not rule_data:
-            rule_data = self.extract_rule_pattern_3(sentence)
+        if not rule_data and try_effect_patterns:
+            rule_data = self.extract_rule_pattern_3(sentence, text_clean)
         
         # Pattern 4: House lordship
-        if not rule_data:
-            rule_data = self.extract_rule_pattern_4(sentence)
+        if not rule_data and try_effect_patterns:
+            rule_data = self.extract_rule_pattern_4(sentence, text_clean)
         
         # Pattern 5: Nakshatra placement
-        if not rule_data:
-            rule_data = self.extract_rule_pattern_5(sentence)
+        if not rule_data and try_effect_patterns:
+            rule_data = self.extract_rule_pattern_5(sentence, text_clean)
         
         # Pattern 6: Yoga combinations
-        if not rule_data:
-            rule_data = self.extract_rule_pattern_6(sentence)
+        if not rule_data and try_yoga_patterns:
+            rule_data = self.extract_rule_pattern_6(sentence, text_clean)
         
         # Fallback to basic extraction
         if not rule_data:
-            planet = self.extract_planet_advanced(sentence)
-            house = self.extract_house_advanced(sentence)
-            sign = self.extract_sign(sentence)
-            ascendant = self.extract_ascendant_context(sentence)
+            planet, house, sign, ascendant = self._extract_components(text_clean)
             
             if planet and (house or sign):
-                effects = self.extract_effects_advanced(sentence)
+                effects = self.extract_effects_advanced(sentence, text_clean)
                 rule_data = {
                     'planet': planet,
                     'house': house,
@@ -919,10 +1073,11 @@ class RuleExtractor:
             if 'effects' in rule_data:
                 effects = rule_data['effects']
             elif 'effect_text' in rule_data:
+                effect_lower = rule_data['effect_text'].lower()
                 effects = [AstrologicalEffect(
-                    category=self.categorize_effect_advanced(rule_data['effect_text']),
+                    category=self.categorize_effect_advanced(rule_data['effect_text'], effect_lower),
                     description=rule_data['effect_text'][:150],
-                    positive=not any(neg in rule_data['effect_text'].lower() for neg in ['problem', 'disease', 'trouble', 'conflict']),
+                    positive=not any(neg in effect_lower for neg in ['problem', 'disease', 'trouble', 'conflict']),
                     strength="medium"
                 )]
             else:
@@ -969,143 +1124,266 @@ class RuleExtractor:
             return rule
             
         except Exception as e:
-            print(f"Error creating improved rule: {e}")
+            logger.warning("Error creating improved rule: %s", e)
             return None
     
-    def extract_rules_from_sentences(self, sentences: List[str], source_info: SourceInfo) -> List[AstrologicalRule]:
+    def extract_rules_from_sentences(self, sentences: List[str], source_info: SourceInfo,
+                                     use_cache: bool = True) -> List[AstrologicalRule]:
         """
         Enhanced rule extraction from sentences with multiple strategies for maximum extraction
         Uses progressively relaxed criteria to capture more rules from classical texts
+        
+        Sentences seen before (in this or an earlier book) reuse their cached
+        extraction unless use_cache is False.
         """
         rules = []
         rule_counter = 1
         
         print(f"🔄 Processing {len(sentences)} astrological sentences for rule extraction...")
         
+        if use_cache and self.cache_path and not self._disk_cache_loaded:
+            self.load_rule_cache()
+        
         for i, sentence in enumerate(sentences):
             if i % 100 == 0:  # Progress indicator
                 print(f"   Progress: {i}/{len(sentences)} sentences processed...")
             
-            # Strategy 1: Use the improved extraction method (most comprehensive)
-            rule = self.extract_rule_from_sentence_improved(sentence, source_info)
+            if use_cache and sentence in self._rule_cache:
+                cached = self._rule_cache[sentence]
+                rule = self._rebind_rule(cached, source_info) if cached else None
+            else:
+                rule = self.extract_rule_from_sentence(sentence, source_info)
+                if use_cache and len(self._rule_cache) < RULE_CACHE_SIZE:
+                    self._rule_cache[sentence] = rule
+                    if self.cache_path:
+                        self._unsaved_rules[sentence] = rule
             
             if rule:
                 rule.id = f"{source_info.title.lower().replace(' ', '_')}_{rule_counter}"
                 rules.append(rule)
                 rule_counter += 1
-                continue
-            
-            # Strategy 2: Fallback with relaxed requirements - just need astrological content
-            cleaned_text = self.clean_ocr_text(sentence)
-            
-            # Try to extract any astrological components
-            planet = self.extract_planet_advanced(cleaned_text)
-            house = self.extract_house_advanced(cleaned_text)
-            sign = self.extract_sign(cleaned_text)
-            ascendant = self.extract_ascendant_context(cleaned_text)
-            
-            # Create rule if we have ANY meaningful astrological component
-            should_create_rule = False
-            confidence_base = 0.2  # Lower base confidence for relaxed extraction
-            
-            # Primary criteria: Planet with any context
-            if planet and (house or sign or ascendant):
-                should_create_rule = True
-                confidence_base = 0.4
-            
-            # Secondary criteria: House with any context  
-            elif house and (sign or ascendant):
-                should_create_rule = True
-                confidence_base = 0.3
-            
-            # Tertiary criteria: Multiple components without planet
-            elif house and sign:
-                should_create_rule = True
-                confidence_base = 0.25
-            
-            # Quaternary criteria: Strong astrological keywords
-            elif any(keyword in cleaned_text.lower() for keyword in [
-                'yoga', 'dosha', 'dasa', 'bhava', 'graha', 'rasi', 'nakshatra',
-                'exalted', 'debilitated', 'moolatrikona', 'aspects', 'conjunction',
-                'lord of', 'ruler of', 'placed in', 'posited in', 'occupies'
-            ]):
-                should_create_rule = True
-                confidence_base = 0.2
+        
+        self.save_rule_cache()
+        
+        print(f"✅ Extraction complete: {len(rules)} rules extracted from {len(sentences)} sentences")
+        return rules
+    
+    def _tables_version(self) -> str:
+        """Cache version key: RULE_CACHE_VERSION and a digest of the pattern and keyword tables"""
+        tables = repr([(name, value) for name, value in vars(self).items()
+                       if not name.startswith('_') and isinstance(value, (dict, list, tuple))])
+        return f"{RULE_CACHE_VERSION}:{hashlib.sha1(tables.encode('utf-8')).hexdigest()[:16]}"
+    
+    def load_rule_cache(self):
+        """
+        Load cached extraction results from cache_path
+        
+        Rules are stored as the knowledge base's column values in JSON, so
+        reading the cache never runs code. An entry that doesn't decode is
+        skipped and its sentence extracted again.
+        """
+        self._disk_cache_loaded = True
+        
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
             
-            if should_create_rule:
-                try:
-                    # Extract effects with relaxed criteria
-                    effects = self.extract_effects_advanced(cleaned_text)
-                    if not effects:
-                        # Create a general effect if none found
-                        effects = [AstrologicalEffect(
-                            category=self.categorize_effect_from_sentence(cleaned_text),
-                            description=self.extract_general_effect(cleaned_text),
-                            positive=self.determine_effect_polarity(cleaned_text),
-                            strength="medium"
-                        )]
+            conn = sqlite3.connect(self.cache_path, timeout=30)
+            try:
+                with conn:
+                    # Batch workers share this file
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS rule_cache (
+                            sentence TEXT PRIMARY KEY,
+                            version TEXT NOT NULL,
+                            rule TEXT
+                        )
+                    """)
                     
-                    # Create condition
-                    condition = AstrologicalCondition(
-                        planet=planet,
-                        house=house,
-                        sign=sign,
-                        additional_conditions={
-                            'ascendant_context': ascendant,
-                            'extraction_method': 'relaxed_fallback',
-                            'raw_sentence': cleaned_text[:100]  # Keep part of original for context
-                        } if ascendant else {'extraction_method': 'relaxed_fallback'}
+                    cursor = conn.execute(
+                        "SELECT sentence, rule FROM rule_cache WHERE version = ? LIMIT ?",
+                        (self._cache_version, RULE_CACHE_SIZE)
                     )
                     
-                    # Calculate confidence with additional factors
-                    confidence = self.calculate_relaxed_confidence(cleaned_text, {
-                        'planet': planet,
-                        'house': house, 
-                        'sign': sign,
-                        'ascendant': ascendant,
-                        'effects': effects
-                    })
-                    
-                    # Generate comprehensive tags
-                    tags = []
-                    if planet:
-                        tags.append(f"planet:{planet.lower()}")
-                    if house:
-                        tags.append(f"house:{house}")
-                    if sign:
-                        tags.append(f"sign:{sign.lower()}")
-                    if ascendant:
-                        tags.append(f"ascendant:{ascendant.lower()}")
-                    
-                    # Add effect-based tags
-                    for effect in effects:
-                        tags.append(f"category:{effect.category}")
-                        if not effect.positive:
-                            tags.append("negative")
-                    
-                    # Add extraction method tag
-                    tags.append("method:relaxed")
-                    
-                    # Create rule
-                    rule = AstrologicalRule(
-                        id=f"{source_info.title.lower().replace(' ', '_')}_{rule_counter}",
-                        original_text=sentence.strip(),
-                        conditions=condition,
-                        effects=effects,
-                        source=source_info,
-                        tags=tags,
-                        confidence_score=confidence
+                    for sentence, value in cursor:
+                        try:
+                            rule = KnowledgeBase.deserialize_rule(tuple(loads_json(value))) if value is not None else None
+                        except Exception:
+                            continue
+                        self._rule_cache[sentence] = rule
+            finally:
+                conn.close()
+        
+        except sqlite3.Error as e:
+            logger.warning("Could not load rule cache %s: %s", self.cache_path, e)
+    
+    def save_rule_cache(self):
+        """Write extraction results added since the last save to cache_path"""
+        if not self.cache_path or not self._unsaved_rules:
+            return
+        
+        rows = [
+            (sentence, self._cache_version,
+             dumps_json(list(KnowledgeBase.serialize_rule(rule).values())) if rule is not None else None)
+            for sentence, rule in self._unsaved_rules.items()
+        ]
+        
+        try:
+            conn = sqlite3.connect(self.cache_path, timeout=30)
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO rule_cache (sentence, version, rule) VALUES (?, ?, ?)",
+                        rows
                     )
-                    
-                    rules.append(rule)
-                    rule_counter += 1
-                    
-                except Exception as e:
-                    print(f"Warning: Error creating relaxed rule from '{sentence[:50]}...': {e}")
-                    continue
+            finally:
+                conn.close()
+            self._unsaved_rules = {}
         
-        print(f"✅ Extraction complete: {len(rules)} rules extracted from {len(sentences)} sentences")
-        return rules
+        except sqlite3.Error as e:
+            logger.warning("Could not save rule cache %s: %s", self.cache_path, e)
+    
+    def _rebind_rule(self, rule: AstrologicalRule, source_info: SourceInfo) -> AstrologicalRule:
+        """Copy a cached rule for a new source"""
+        return dataclasses.replace(
+            rule,
+            source=source_info,
+            tags=list(rule.tags),
+            created_at=datetime.now()
+        )
+    
+    def extract_rule_from_sentence(self, sentence: str, source_info: SourceInfo) -> Optional[AstrologicalRule]:
+        """Extract a rule from one sentence, falling back to relaxed criteria"""
+        
+        cleaned_text = self.clean_ocr_text(sentence)
+        
+        # Strategy 1: Use the improved extraction method (most comprehensive)
+        rule = self.extract_rule_from_sentence_improved(sentence, source_info, cleaned_text)
+        
+        if rule:
+            return rule
+        
+        # Strategy 2: Fallback with relaxed requirements - just need astrological content
+        # The component extractors clean their input again; do that pass once
+        recleaned_text = self.clean_ocr_text(cleaned_text)
+        
+        # Try to extract any astrological components (cleaning is usually
+        # idempotent, and then these are the ones Strategy 1 already found)
+        planet, house, sign, ascendant = self._extract_components(recleaned_text)
+        
+        # Create rule if we have ANY meaningful astrological component
+        should_create_rule = False
+        confidence_base = 0.2  # Lower base confidence for relaxed extraction
+        
+        # Primary criteria: Planet with any context
+        if planet and (house or sign or ascendant):
+            should_create_rule = True
+            confidence_base = 0.4
+        
+        # Secondary criteria: House with any context  
+        elif house and (sign or ascendant):
+            should_create_rule = True
+            confidence_base = 0.3
+        
+        # Tertiary criteria: Multiple components without planet
+        elif house and sign:
+            should_create_rule = True
+            confidence_base = 0.25
+        
+        # Quaternary criteria: Strong astrological keywords
+        elif any(keyword in cleaned_text.lower() for keyword in [
+            'yoga', 'dosha', 'dasa', 'bhava', 'graha', 'rasi', 'nakshatra',
+            'exalted', 'debilitated', 'moolatrikona', 'aspects', 'conjunction',
+            'lord of', 'ruler of', 'placed in', 'posited in', 'occupies'
+        ]):
+            should_create_rule = True
+            confidence_base = 0.2
+        
+        if should_create_rule:
+            try:
+                # Extract effects with relaxed criteria
+                effects = self.extract_effects_advanced(cleaned_text, recleaned_text)
+                if not effects:
+                    # Create a general effect if none found
+                    effects = [AstrologicalEffect(
+                        category=self.categorize_effect_from_sentence(cleaned_text),
+                        description=self.extract_general_effect(cleaned_text),
+                        positive=self.determine_effect_polarity(cleaned_text),
+                        strength="medium"
+                    )]
+                
+                # Create condition
+                condition = AstrologicalCondition(
+                    planet=planet,
+                    house=house,
+                    sign=sign,
+                    additional_conditions={
+                        'ascendant_context': ascendant,
+                        'extraction_method': 'relaxed_fallback',
+                        'raw_sentence': cleaned_text[:100]  # Keep part of original for context
+                    } if ascendant else {'extraction_method': 'relaxed_fallback'}
+                )
+                
+                # Calculate confidence with additional factors
+                confidence = self.calculate_relaxed_confidence(cleaned_text, {
+                    'planet': planet,
+                    'house': house, 
+                    'sign': sign,
+                    'ascendant': ascendant,
+                    'effects': effects
+                })
+                
+                # Generate comprehensive tags
+                tags = []
+                if planet:
+                    tags.append(f"planet:{planet.lower()}")
+                if house:
+                    tags.append(f"house:{house}")
+                if sign:
+                    tags.append(f"sign:{sign.lower()}")
+                if ascendant:
+                    tags.append(f"ascendant:{ascendant.lower()}")
+                
+                # Add effect-based tags
+                for effect in effects:
+                    tags.append(f"category:{effect.category}")
+                    if not effect.positive:
+                        tags.append("negative")
+                
+                # Add extraction method tag
+                tags.append("method:relaxed")
+                
+                # Create rule
+                rule = AstrologicalRule(
+                    id="",  # Numbered by extract_rules_from_sentences
+                    original_text=sentence.strip(),
+                    conditions=condition,
+                    effects=effects,
+                    source=source_info,
+                    tags=tags,
+                    confidence_score=confidence
+                )
+                
+                return rule
+                
+            except Exception as e:
+                logger.warning("Error creating relaxed rule from '%s...': %s", sentence[:50], e)
+        
+        return None
+    
+    def _extract_components(self, text_clean: str) -> Tuple:
+        """Planet, house, sign and ascendant context of an OCR-cleaned text"""
+        if self._last_components is not None and self._last_components[0] == text_clean:
+            return self._last_components[1]
+        
+        components = (
+            self.extract_planet_advanced(text_clean, text_clean),
+            self.extract_house_advanced(text_clean, text_clean),
+            self.extract_sign(text_clean, text_clean),
+            self.extract_ascendant_context(text_clean, text_clean)
+        )
+        self._last_components = (text_clean, components)
+        return components
     
     def calculate_relaxed_confidence(self, sentence: str, components: Dict) -> float:
         """Calculate confidence for relaxed extraction with lower thresholds"""
@@ -1142,25 +1420,18 @@ class RuleExtractor:
             'lord', 'ruler', 'aspect', 'conjunction', 'trine', 'square'
         ]
         
-        classical_count = sum(1 for term in classical_bonus_terms if term in sentence.lower())
+        sentence_lower = sentence.lower()
+        classical_count = sum(1 for term in classical_bonus_terms if term in sentence_lower)
         confidence += min(0.15, classical_count * 0.03)
         
         # Astrological structure bonus
-        structure_patterns = [
-            r'if\s+.*?\s+then\s+.*',  # Conditional structure
-            r'when\s+.*?\s+.*',       # Temporal structure  
-            r'.*?\s+gives?\s+.*',     # Causal structure
-            r'.*?\s+causes?\s+.*',    # Causal structure
-            r'.*?\s+results?\s+in\s+.*'  # Result structure
-        ]
-        
-        for pattern in structure_patterns:
-            if re.search(pattern, sentence.lower()):
+        for pattern in self._structure_patterns:
+            if pattern.search(sentence_lower):
                 confidence += 0.05
                 break
         
         # Penalty for very poor quality indicators
-        if len(re.findall(r'[a-z]{20,}', sentence)) > 1:  # Too many merged words
+        if len(self._long_merged_word_re.findall(sentence)) > 1:  # Too many merged words
             confidence -= 0.1
         
         if sentence.count('?') > 2 or sentence.count('!') > 2:  # Too much punctuation
@@ -1172,23 +1443,7 @@ class RuleExtractor:
         """Categorize effect based on sentence content when no explicit effect found"""
         sentence_lower = sentence.lower()
         
-        # Enhanced categorization keywords
-        category_keywords = {
-            'wealth': ['wealth', 'money', 'riches', 'prosperity', 'financial', 'dhan', 'sampatti'],
-            'health': ['health', 'disease', 'illness', 'body', 'medical', 'roga', 'arogya'],
-            'marriage': ['marriage', 'spouse', 'partner', 'wife', 'husband', 'vivah', 'patni'],
-            'career': ['career', 'job', 'profession', 'work', 'business', 'karma', 'vyavasaya'],
-            'education': ['education', 'learning', 'knowledge', 'study', 'vidya', 'gyan'],
-            'family': ['children', 'parents', 'siblings', 'family', 'putra', 'mata', 'pita'],
-            'spiritual': ['spiritual', 'religious', 'devotion', 'dharma', 'moksha', 'tapas'],
-            'government': ['king', 'ruler', 'authority', 'government', 'raja', 'adhikari'],
-            'travel': ['travel', 'journey', 'foreign', 'pravasa', 'yatra'],
-            'enemies': ['enemy', 'enemies', 'opponent', 'satru', 'ari'],
-            'property': ['property', 'land', 'house', 'bhumi', 'griha'],
-            'fortune': ['fortune', 'luck', 'destiny', 'bhagya', 'daiva']
-        }
-        
-        for category, keywords in category_keywords.items():
+        for category, keywords in self.sentence_categories.items():
             if any(keyword in sentence_lower for keyword in keywords):
                 return category
         
@@ -1208,24 +1463,18 @@ class RuleExtractor:
     def extract_general_effect(self, sentence: str) -> str:
         """Extract a general effect description when specific effects not found"""
         # Try to find any outcome or result description
-        effect_indicators = [
-            r'(?:gives?|causes?|brings?|produces?|results?\s+in|leads?\s+to)\s+([^.!?]*)',
-            r'(?:will\s+have|will\s+get|will\s+be|will\s+become)\s+([^.!?]*)',
-            r'(?:makes?|renders?|creates?)\s+([^.!?]*)',
-            r'(?:indicates?|signifies?|shows?)\s+([^.!?]*)'
-        ]
-        
-        for pattern in effect_indicators:
-            match = re.search(pattern, sentence, re.IGNORECASE)
+        for pattern in self._general_effect_patterns:
+            match = pattern.search(sentence)
             if match:
                 effect_text = match.group(1).strip()
                 if len(effect_text) > 3:
                     return effect_text[:100]  # Limit length
         
         # If no explicit effect found, create contextual effect
-        if any(term in sentence.lower() for term in ['good', 'beneficial', 'auspicious', 'favorable']):
+        sentence_lower = sentence.lower()
+        if any(term in sentence_lower for term in ['good', 'beneficial', 'auspicious', 'favorable']):
             return "beneficial astrological influence"
-        elif any(term in sentence.lower() for term in ['bad', 'harmful', 'inauspicious', 'unfavorable']):
+        elif any(term in sentence_lower for term in ['bad', 'harmful', 'inauspicious', 'unfavorable']):
             return "challenging astrological influence"
         else:
             return "notable astrological influence"
@@ -0,0 +1,91 @@
+# tests/conftest.py
+"""
+Shared fixtures for the Astrology AI test suite
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src package importable when pytest runs from the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data_models import create_simple_rule
+from src.knowledge_base import KnowledgeBase
+
+
+def make_rule(rule_id, text, planet=None, house=None, effect_desc=None, tags=None,
+              source_title="Test Source"):
+    """Create a simple rule with an ID and tags, ready to store"""
+    rule = create_simple_rule(text, source_title, planet=planet, house=house, effect_desc=effect_desc)
+    rule.id = rule_id
+    rule.tags = list(tags or [])
+    return rule
+
+
+# The rules table as it was before rule_tags and rule_effects were added
+LEGACY_SCHEMA = """
+    CREATE TABLE rules (
+        id TEXT PRIMARY KEY,
+        original_text TEXT NOT NULL,
+        planet TEXT,
+        house INTEGER,
+        sign TEXT,
+        nakshatra TEXT,
+        conditions_json TEXT,
+        effects_json TEXT NOT NULL,
+        source_title TEXT NOT NULL,
+        source_author TEXT,
+        source_page INTEGER,
+        authority_level INTEGER,
+        tags_json TEXT,
+        confidence_score REAL DEFAULT 0.5,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP
+    )
+"""
+
+
+def create_legacy_db(db_path, rules, overrides=None):
+    """
+    Write rules into a database with only the legacy rules table
+    
+    overrides maps a rule ID to column values stored in place of the
+    serialized ones, e.g. {'test_1': {'tags_json': None}}.
+    """
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(LEGACY_SCHEMA)
+        for rule in rules:
+            row = KnowledgeBase.serialize_rule(rule)
+            row.update((overrides or {}).get(rule.id, {}))
+            conn.execute(
+                "INSERT INTO rules (" + ", ".join(row) + ") VALUES (" + ", ".join("?" * len(row)) + ")",
+                list(row.values())
+            )
+    conn.close()
+
+
+@pytest.fixture
+def sample_rules():
+    """A few rules covering planets, houses and tags"""
+    return [
+        make_rule("test_1", "Mars in the 7th house causes conflicts in marriage",
+                  planet="Mars", house=7, effect_desc="conflicts in marriage",
+                  tags=["planet_mars", "house_7"]),
+        make_rule("test_2", "Jupiter in its own sign gives wisdom and prosperity",
+                  planet="Jupiter", effect_desc="wisdom and prosperity",
+                  tags=["planet_jupiter", "benefic"]),
+        make_rule("test_3", "Mars in the 10th house gives success in career",
+                  planet="Mars", house=10, effect_desc="success in career",
+                  tags=["planet_mars", "house_10", "career"]),
+    ]
+
+
+@pytest.fixture
+def kb(tmp_path):
+    """An empty knowledge base in a temporary directory"""
+    knowledge_base = KnowledgeBase(str(tmp_path / "rules.db"))
+    yield knowledge_base
+    knowledge_base.close()
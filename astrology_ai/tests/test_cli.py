@@ -0,0 +1,151 @@
+# tests/test_cli.py
+"""
+Smoke tests for the Click command line interface
+"""
+
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.cli import cli
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_help_lists_every_command():
+    result = CliRunner().invoke(cli, ['--help'])
+    
+    assert result.exit_code == 0
+    for name in cli.commands:
+        assert name in result.output
+
+
+def _run(*args):
+    """Run a Python command line from the project root"""
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, encoding='utf-8'
+    )
+
+
+def test_main_cli_help_is_rendered_by_click():
+    via_main = _run('main.py', 'cli', '--help')
+    via_click = _run('-m', 'src.cli', '--help')
+    
+    assert via_main.returncode == 0
+    assert via_main.stdout == via_click.stdout.replace('Usage: python -m src.cli', 'Usage: cli')
+
+
+def test_main_cli_without_command_matches_click():
+    via_main = _run('main.py', 'cli')
+    via_click = _run('-m', 'src.cli')
+    
+    assert via_main.returncode == via_click.returncode
+    assert 'Usage: cli' in via_main.stdout + via_main.stderr
+
+
+def test_every_command_has_help():
+    runner = CliRunner()
+    
+    for name in cli.commands:
+        result = runner.invoke(cli, [name, '--help'])
+        assert result.exit_code == 0, name
+        assert 'Usage:' in result.output
+
+
+def test_stats_on_empty_knowledge_base(kb):
+    result = CliRunner().invoke(cli, ['stats'], obj={'kb': kb})
+    
+    assert result.exit_code == 0
+    assert "Total rules: 0" in result.output
+
+
+def test_search_rules_filters_by_planet(kb, sample_rules):
+    kb.store_rules_batch(sample_rules)
+    
+    result = CliRunner().invoke(cli, ['search-rules', '--planet', 'Mars'], obj={'kb': kb})
+    
+    assert result.exit_code == 0
+    assert "conflicts in marriage" in result.output
+    assert "success in career" in result.output
+    assert "wisdom and prosperity" not in result.output
+
+
+def test_export_knowledge_json(kb, sample_rules, tmp_path):
+    kb.store_rules_batch(sample_rules)
+    output = tmp_path / "export.json"
+    
+    result = CliRunner().invoke(cli, ['export-knowledge', '--output', str(output)], obj={'kb': kb})
+    
+    assert result.exit_code == 0
+    assert "Exported 3 rules" in result.output
+    assert output.exists()
+
+
+def test_batch_process_workers_do_not_write_over_progress(tmp_path):
+    from PyPDF2 import PdfWriter
+    
+    for i in range(3):
+        writer = PdfWriter()
+        writer.add_blank_page(width=200, height=200)
+        with open(tmp_path / f"book{i}.pdf", 'wb') as f:
+            writer.write(f)
+    
+    result = _run('-m', 'src.cli', 'batch-process', str(tmp_path), '--workers', '2')
+    
+    assert result.returncode == 0
+    assert "Processing document" not in result.stdout
+    assert "Extracting text from" not in result.stdout
+    assert "Processed 3 PDF files" in result.stdout
+
+
+def test_batch_process_rejects_worker_counts_below_one(tmp_path):
+    runner = CliRunner()
+    
+    for workers in ('0', '-3'):
+        result = runner.invoke(cli, ['batch-process', str(tmp_path), '--workers', workers])
+        assert result.exit_code == 2, workers
+        assert "Invalid value for '--workers'" in result.output
+
+
+def test_process_book_extracts_in_process_by_default(tmp_path, monkeypatch):
+    from PyPDF2 import PdfWriter
+    from src import cli as cli_module
+    
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    pdf_path = tmp_path / "book.pdf"
+    with open(pdf_path, 'wb') as f:
+        writer.write(f)
+    
+    processor = cli_module._get_processor()
+    calls = []
+    process_document = processor.process_document
+    
+    def record(path, workers=1):
+        calls.append(workers)
+        return process_document(path, workers=workers)
+    
+    monkeypatch.setattr(processor, 'process_document', record)
+    result = CliRunner().invoke(cli, ['process-book', str(pdf_path)])
+    
+    assert result.exit_code == 0
+    assert calls == [1]
+
+
+def test_export_knowledge_snapshot(kb, sample_rules, tmp_path):
+    kb.store_rules_batch(sample_rules)
+    output = tmp_path / "snapshot.db"
+    
+    result = CliRunner().invoke(cli, ['export-knowledge', '--snapshot', '--output', str(output)],
+                                obj={'kb': kb})
+    
+    assert result.exit_code == 0
+    assert "Exported 3 rules" in result.output
+    with sqlite3.connect(str(output)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM rules").fetchone()[0] == 3
+    conn.close()
+
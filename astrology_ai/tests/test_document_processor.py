@@ -0,0 +1,87 @@
+# tests/test_document_processor.py
+"""
+Tests for the document processing pipeline
+"""
+
+import itertools
+
+import pytest
+
+from src.document_processor import (
+    DocumentProcessor, ARROW_MIN_SENTENCES, ASTRO_KEYWORDS,
+    _filter_astrological_arrow, _is_astrological
+)
+
+TEXT = (
+    "Mars in the 7th house causes conflicts in marriage. "
+    "The weather was pleasant on the day the book was printed. "
+    "Jupiter in Sagittarius gives wisdom and wealth to the native. "
+    "This chapter describes the history of the manuscript in detail. "
+    "Saturn aspecting the Moon brings sorrow and delays in career."
+)
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    processor = DocumentProcessor()
+    monkeypatch.setattr(processor, 'extract_text', lambda pdf_path, workers=1: TEXT)
+    return processor
+
+
+def test_process_document_keeps_only_astrological_sentences(processor):
+    clean_text = processor.clean_text(TEXT)
+    sentences = processor.chunk_into_sentences(clean_text)
+    
+    result = processor.process_document("book.pdf")
+    
+    assert result.filename == "book.pdf"
+    assert result.sentence_count == len(sentences)
+    assert result.astrological_sentences == processor.identify_astrological_content(sentences)
+    assert result.astrological_sentences
+    assert result.extracted_text is None
+    assert result.sentences is None
+
+
+def test_process_document_keep_text(processor):
+    clean_text = processor.clean_text(TEXT)
+    default = processor.process_document("book.pdf")
+    
+    result = processor.process_document("book.pdf", keep_text=True)
+    
+    assert result.extracted_text == clean_text
+    assert result.sentences == processor.chunk_into_sentences(clean_text)
+    assert result.sentence_count == len(result.sentences)
+    assert result.astrological_sentences == default.astrological_sentences
+
+
+def _keyword_sentences():
+    """Sentences pairing planets with every house, sign and effect keyword, plus near misses"""
+    planets = ('Mars', 'MOON', 'jupiter', 'Sūrya', 'ſun')
+    others = [word for category in ('houses', 'signs', 'effects') for word in ASTRO_KEYWORDS[category]]
+    others += ['results  in', 'house-hold', 'leadsto', 'İnfluence', 'nothing astrological']
+    
+    sentences = [f"{planet} {word} the native." for planet, word in itertools.product(planets, others)]
+    sentences += [f"The {word} is mentioned without any planet." for word in others]
+    sentences += ["Plain prose about the history of the manuscript."] * ARROW_MIN_SENTENCES
+    return sentences
+
+
+def test_arrow_filter_matches_python_filter():
+    pa = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.compute")
+    sentences = _keyword_sentences()
+    
+    expected = [sentence for sentence in sentences if _is_astrological(sentence)]
+    
+    assert expected
+    assert _filter_astrological_arrow(pa, sentences) == expected
+
+
+def test_identify_astrological_content_large_list():
+    processor = DocumentProcessor()
+    sentences = _keyword_sentences()
+    
+    assert len(sentences) >= ARROW_MIN_SENTENCES
+    assert processor.identify_astrological_content(sentences) == [
+        sentence for sentence in sentences if processor.contains_astrological_content(sentence)
+    ]
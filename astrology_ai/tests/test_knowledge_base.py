@@ -0,0 +1,157 @@
+# tests/test_knowledge_base.py
+"""
+Tests for the knowledge base schema, migrations and queries
+"""
+
+import json
+import sqlite3
+
+from src.knowledge_base import KnowledgeBase
+
+from conftest import create_legacy_db, make_rule
+
+
+def _json_tag_scan(db_path, tag):
+    """Rule IDs with tag, found the way get_rules_by_tag did before rule_tags"""
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT id, tags_json FROM rules ORDER BY rowid").fetchall()
+    conn.close()
+    return [rule_id for rule_id, tags_json in rows if tag in json.loads(tags_json or '[]')]
+
+
+def _tag_rows(kb):
+    with kb._connect() as conn:
+        return sorted(tuple(row) for row in conn.execute("SELECT rule_id, tag FROM rule_tags"))
+
+
+def test_legacy_db_tag_lookup_matches_json_scan(tmp_path, sample_rules):
+    db_path = str(tmp_path / "legacy.db")
+    untagged = make_rule("test_4", "Venus in the 2nd house gives wealth", planet="Venus", house=2)
+    create_legacy_db(db_path, sample_rules + [untagged], overrides={"test_4": {"tags_json": None}})
+    
+    kb = KnowledgeBase(db_path)
+    tags = {tag for rule in sample_rules for tag in rule.tags} | {"missing"}
+    
+    for tag in tags:
+        assert [rule.id for rule in kb.get_rules_by_tag(tag)] == _json_tag_scan(db_path, tag), tag
+    kb.close()
+
+
+def test_legacy_db_backfill_runs_once(tmp_path, sample_rules):
+    db_path = str(tmp_path / "legacy.db")
+    create_legacy_db(db_path, sample_rules)
+    
+    kb = KnowledgeBase(db_path)
+    first = _tag_rows(kb)
+    kb.close()
+    kb = KnowledgeBase(db_path)
+    
+    assert first == sorted((rule.id, tag) for rule in sample_rules for tag in rule.tags)
+    assert _tag_rows(kb) == first
+    kb.close()
+
+
+def test_store_rules_batch_replaces_tags(kb, sample_rules):
+    kb.store_rules_batch(sample_rules)
+    
+    retagged = make_rule("test_1", sample_rules[0].original_text, planet="Mars", house=7,
+                         effect_desc="conflicts in marriage", tags=["planet_mars", "marriage"])
+    kb.store_rules_batch([retagged])
+    
+    assert [rule.id for rule in kb.get_rules_by_tag("house_7")] == []
+    assert [rule.id for rule in kb.get_rules_by_tag("marriage")] == ["test_1"]
+    assert sorted(rule.id for rule in kb.get_rules_by_tag("planet_mars")) == ["test_1", "test_3"]
+    assert [(rule_id, tag) for rule_id, tag in _tag_rows(kb) if rule_id == "test_1"] == [
+        ("test_1", "marriage"), ("test_1", "planet_mars")
+    ]
+
+
+def test_store_rules_batch_tags_match_stored_rules(kb, sample_rules):
+    kb.store_rules_batch(sample_rules)
+    
+    assert _tag_rows(kb) == sorted((rule.id, tag) for rule in sample_rules for tag in rule.tags)
+    for rule in sample_rules:
+        for tag in rule.tags:
+            assert rule.id in [found.id for found in kb.get_rules_by_tag(tag)]
+
+
+def _conflicting_rule():
+    rule = make_rule("test_5", "Mars in the 7th house gives a happy marriage",
+                     planet="Mars", house=7, effect_desc="happy marriage")
+    rule.effects[0].positive = False
+    return rule
+
+
+def test_legacy_db_migration_skips_undecodable_effects(tmp_path, sample_rules):
+    db_path = str(tmp_path / "legacy.db")
+    broken = [make_rule(f"broken_{i}", f"Mars in the 7th house, broken row {i}", planet="Mars", house=7)
+              for i in range(3)]
+    create_legacy_db(db_path, sample_rules + [_conflicting_rule()] + broken, overrides={
+        "broken_0": {"effects_json": ""},
+        "broken_1": {"effects_json": "not json"},
+        "broken_2": {"effects_json": "null"},
+    })
+    
+    kb = KnowledgeBase(db_path)
+    
+    assert [rule.id for rule in kb.get_conflicting_rules(sample_rules[0])] == ["test_5"]
+    assert [rule.id for rule in kb.get_conflicting_rules(_conflicting_rule())] == ["test_1"]
+    with kb._connect() as conn:
+        effect_ids = {row['rule_id'] for row in conn.execute("SELECT rule_id FROM rule_effects")}
+    assert effect_ids == {"test_1", "test_2", "test_3", "test_5"}
+    kb.close()
+    
+    # The migration is recorded, so the next open doesn't trip over the rows either
+    KnowledgeBase(db_path).close()
+
+
+def test_legacy_db_migration_skips_undecodable_tags(tmp_path, sample_rules):
+    db_path = str(tmp_path / "legacy.db")
+    broken = [make_rule(f"broken_{i}", f"Mars in the 7th house, broken row {i}", planet="Mars", house=7,
+                        tags=["planet_mars"])
+              for i in range(3)]
+    create_legacy_db(db_path, sample_rules + broken, overrides={
+        "broken_0": {"tags_json": "not json"},
+        "broken_1": {"tags_json": "null"},
+        "broken_2": {"tags_json": '"planet_mars"'},
+    })
+    
+    kb = KnowledgeBase(db_path)
+    
+    assert kb.get_database_stats()['total_rules'] == 6
+    assert sorted(rule.id for rule in kb.get_rules_by_tag("planet_mars")) == ["test_1", "test_3"]
+    with kb._connect() as conn:
+        tagged_ids = {row['rule_id'] for row in conn.execute("SELECT rule_id FROM rule_tags")}
+    assert tagged_ids == {"test_1", "test_2", "test_3"}
+    kb.close()
+    
+    KnowledgeBase(db_path).close()
+
+
+def test_conflicting_rules_after_store(kb, sample_rules):
+    kb.store_rules_batch(sample_rules + [_conflicting_rule()])
+    
+    assert [rule.id for rule in kb.get_conflicting_rules(sample_rules[0])] == ["test_5"]
+    assert kb.get_conflicting_rules(sample_rules[2]) == []
+
+
+def test_export_db_snapshot_copies_every_table(kb, sample_rules, tmp_path):
+    kb.store_rules_batch(sample_rules)
+    snapshot_path = tmp_path / "exports" / "snapshot.db"
+    
+    assert kb.export_db_snapshot(str(snapshot_path)) == str(snapshot_path)
+    
+    with kb._connect() as conn:
+        expected = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ("rules", "rule_tags", "rule_effects")}
+    snapshot = KnowledgeBase(str(snapshot_path))
+    with snapshot._connect() as conn:
+        copied = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in expected}
+    
+    assert expected["rules"] == len(sample_rules)
+    assert copied == expected
+    assert [rule.id for rule in snapshot.search_rules(planet="Mars")] == \
+        [rule.id for rule in kb.search_rules(planet="Mars")]
+    snapshot.close()
+
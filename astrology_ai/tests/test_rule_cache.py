@@ -0,0 +1,137 @@
+# tests/test_rule_cache.py
+"""
+Tests for the RuleExtractor sentence cache and its on-disk copy
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.data_models import SourceInfo, AuthorityLevel
+from src.rule_extractor import RuleExtractor
+
+SENTENCES = [
+    "Mars in the 7th house causes conflicts in marriage",
+    "Jupiter in its own sign gives wisdom and prosperity",
+    "Saturn aspects the Moon and brings sorrow to the native",
+    "The lord of the 10th in the 9th house gives a high position",
+    "This sentence has nothing astrological in it",
+]
+
+
+def _content(rule):
+    """The parts of a rule that come from the sentence, not the source"""
+    return (rule.original_text, rule.conditions, rule.effects, rule.tags, rule.confidence_score)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "rule_cache.sqlite")
+
+
+@pytest.fixture
+def fresh_rules():
+    source = SourceInfo(title="Fresh")
+    return RuleExtractor().extract_rules_from_sentences(SENTENCES, source, use_cache=False)
+
+
+def test_cache_hit_rebinds_source(cache_path, fresh_rules, monkeypatch):
+    first_source = SourceInfo(title="Book A", authority_level=AuthorityLevel.CLASSICAL)
+    second_source = SourceInfo(title="Book B", author="Someone")
+    RuleExtractor(cache_path=cache_path).extract_rules_from_sentences(SENTENCES, first_source)
+    
+    extractor = RuleExtractor(cache_path=cache_path)
+    
+    def fail(*args):
+        raise AssertionError("sentence should have come from the cache")
+    
+    monkeypatch.setattr(extractor, 'extract_rule_from_sentence', fail)
+    rules = extractor.extract_rules_from_sentences(SENTENCES, second_source)
+    
+    assert [_content(rule) for rule in rules] == [_content(rule) for rule in fresh_rules]
+    assert all(rule.source is second_source for rule in rules)
+    assert [rule.id for rule in rules] == [f"book_b_{i}" for i in range(1, len(rules) + 1)]
+
+
+def test_cache_hits_do_not_share_tags(cache_path):
+    extractor = RuleExtractor(cache_path=cache_path)
+    first = extractor.extract_rules_from_sentences(SENTENCES[:1], SourceInfo(title="Book A"))
+    second = extractor.extract_rules_from_sentences(SENTENCES[:1], SourceInfo(title="Book B"))
+    
+    second[0].tags.append("edited")
+    
+    assert "edited" not in first[0].tags
+
+
+def test_corrupt_cache_file_is_a_cache_miss(cache_path, fresh_rules):
+    Path(cache_path).parent.mkdir(parents=True)
+    Path(cache_path).write_bytes(b"this is not a sqlite database" * 100)
+    extractor = RuleExtractor(cache_path=cache_path)
+    
+    rules = extractor.extract_rules_from_sentences(SENTENCES, SourceInfo(title="Fresh"))
+    
+    assert [_content(rule) for rule in rules] == [_content(rule) for rule in fresh_rules]
+
+
+def test_undecodable_cache_entries_are_re_extracted(cache_path, fresh_rules):
+    RuleExtractor(cache_path=cache_path).extract_rules_from_sentences(SENTENCES, SourceInfo(title="Book A"))
+    version = RuleExtractor()._cache_version
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute("UPDATE rule_cache SET rule = ? WHERE sentence = ?",
+                     (b"\x80\x04\x95 pickled bytes", SENTENCES[0]))
+        conn.execute("UPDATE rule_cache SET rule = ? WHERE sentence = ?",
+                     ('["too", "few", "columns"]', SENTENCES[1]))
+    
+    extractor = RuleExtractor(cache_path=cache_path)
+    extractor.load_rule_cache()
+    
+    assert SENTENCES[0] not in extractor._rule_cache
+    assert SENTENCES[1] not in extractor._rule_cache
+    assert SENTENCES[2] in extractor._rule_cache
+    assert extractor._cache_version == version
+    
+    rules = extractor.extract_rules_from_sentences(SENTENCES, SourceInfo(title="Fresh"))
+    assert [_content(rule) for rule in rules] == [_content(rule) for rule in fresh_rules]
+
+
+def test_changed_tables_ignore_old_entries(cache_path):
+    RuleExtractor(cache_path=cache_path).extract_rules_from_sentences(SENTENCES, SourceInfo(title="Book A"))
+    
+    extractor = RuleExtractor(cache_path=cache_path)
+    extractor.planet_names['mars'].append('angaraka')
+    extractor._cache_version = extractor._tables_version()
+    extractor.load_rule_cache()
+    
+    assert extractor._cache_version != RuleExtractor()._cache_version
+    assert extractor._rule_cache == {}
+
+
+def test_cache_connections_are_closed(cache_path, monkeypatch):
+    from src import rule_extractor
+    
+    connections = []
+    connect = sqlite3.connect
+    
+    def record(*args, **kwargs):
+        connections.append(connect(*args, **kwargs))
+        return connections[-1]
+    
+    monkeypatch.setattr(rule_extractor.sqlite3, 'connect', record)
+    RuleExtractor(cache_path=cache_path).extract_rules_from_sentences(SENTENCES, SourceInfo(title="Book A"))
+    
+    assert len(connections) == 2
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_unreadable_cache_is_logged(cache_path, caplog):
+    Path(cache_path).parent.mkdir(parents=True)
+    Path(cache_path).write_bytes(b"this is not a sqlite database" * 100)
+    
+    with caplog.at_level("WARNING", logger="src.rule_extractor"):
+        RuleExtractor(cache_path=cache_path).extract_rules_from_sentences(SENTENCES, SourceInfo(title="Fresh"))
+    
+    assert "Could not load rule cache" in caplog.text
+    assert "Could not save rule cache" in caplog.text
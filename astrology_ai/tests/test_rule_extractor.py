@@ -0,0 +1,104 @@
+# tests/test_rule_extractor.py
+"""
+Tests for the RuleExtractor OCR clean-up and its word prefilters
+"""
+
+import dataclasses
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from src.data_models import SourceInfo, AuthorityLevel
+from src.rule_extractor import RuleExtractor, _literal_word
+
+# Sentences with the clean_ocr_text output and rules the extractor gave for
+# them before the OCR split prefilter was added (hand-written aphorisms, OCR
+# run-together words, sentences from books and random word mixes)
+GOLDEN_PATH = Path(__file__).resolve().parent / "data" / "extractor_golden.json"
+
+
+def _golden():
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _encode(rule):
+    """A rule as plain data, leaving out its ID and source"""
+    return {
+        'conditions': dataclasses.asdict(rule.conditions),
+        'effects': [dataclasses.asdict(effect) for effect in rule.effects],
+        'tags': rule.tags,
+        'confidence_score': rule.confidence_score,
+    }
+
+
+def _source():
+    return SourceInfo(title="Golden Source", authority_level=AuthorityLevel.CLASSICAL)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return RuleExtractor()
+
+
+@pytest.fixture(scope="module")
+def ungated_extractor():
+    """An extractor that runs every OCR split pattern on every text"""
+    extractor = RuleExtractor()
+    extractor._ocr_split_patterns = [(None, pattern) for _, pattern in extractor._ocr_split_patterns]
+    return extractor
+
+
+def test_literal_word():
+    assert _literal_word("gives") == "gives"
+    assert _literal_word("good results") == "good results"
+    assert _literal_word("gives?") is None
+    assert _literal_word("lord of the") == "lord of the"
+    assert _literal_word(r"\d+") is None
+    assert _literal_word("(?:a|b)") is None
+
+
+def test_clean_ocr_text_matches_golden(extractor):
+    for entry in _golden():
+        assert extractor.clean_ocr_text(entry['sentence']) == entry['cleaned'], entry['sentence']
+
+
+def test_extraction_matches_golden(extractor):
+    for entry in _golden():
+        rules = extractor.extract_rules_from_sentences([entry['sentence']], _source(), use_cache=False)
+        assert [_encode(rule) for rule in rules] == entry['rules'], entry['sentence']
+
+
+def test_extraction_is_the_same_without_the_prefilter(extractor, ungated_extractor):
+    sentences = [entry['sentence'] for entry in _golden()]
+    
+    gated = extractor.extract_rules_from_sentences(sentences, _source(), use_cache=False)
+    ungated = ungated_extractor.extract_rules_from_sentences(sentences, _source(), use_cache=False)
+    
+    assert [_encode(rule) for rule in gated] == [_encode(rule) for rule in ungated]
+    for sentence in sentences:
+        assert extractor.clean_ocr_text(sentence) == ungated_extractor.clean_ocr_text(sentence)
+
+
+def test_being_lord_split_matches_unanchored_pattern(extractor):
+    # The lordship phrase is anchored to the start of a clause; the split it
+    # makes must be the one the unanchored phrase made
+    unanchored = re.compile(
+        r'(([^,.]+)\s+being\s+(?:the)?\s+lord\s+of\s+([^,.]+))(?=[A-Z][a-z]|[0-9])', re.IGNORECASE
+    )
+    anchored = next(pattern for _, pattern in extractor._ocr_split_patterns
+                    if r'being\s+(?:the)?\s+lord' in pattern.pattern)
+    texts = [
+        "Mars being the lord of 7Venus",
+        "In this chart, Mars being the lord of the 7th houseGives, and Venus being lord of 2Saturn",
+        "Jupiter being the lordof 9, Saturn being the lord of 10Mercury. Sun being  lord of 5Ab",
+        "Being the lord of 9 Jupiter, Mars BEING THE LORD OF 4Moon being the lord of 3Ketu",
+        "no such phrase here, just 7th house and Mars",
+        "x being the lord of y being the lord of 3z being the lord of Aa",
+    ]
+    
+    for text in texts:
+        assert anchored.subn(r'\1 ', text) == unanchored.subn(r'\1 ', text), text
+    assert sum(anchored.subn(r'\1 ', text)[1] for text in texts) >= 5